@@ -11,35 +11,177 @@ Milvus A/B 테스팅 시스템
 import os
 import sys
 import time
-import random
-import statistics
 import json
 from datetime import datetime, timedelta
+from math import fsum, sqrt
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import threading
+import numpy as np
+import yaml
+
+try:
+    from yaml import CSafeDumper as YamlDumper  # libyaml C 바인딩
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
 
 # 공통 모듈 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
+# Feature flag ConfigMap에 들어가는 config.json (고정 값이므로 한 번만 직렬화)
+_FEATURE_FLAGS_JSON = json.dumps({
+    'ab_tests': {
+        'search_algorithm': {
+            'enabled': True,
+            'treatment_percentage': 50,
+            'feature_flags': {
+                'use_hnsw': True,
+                'optimize_memory': True
+            }
+        }
+    }
+}, indent=2)
+
+# Traffic Splitting을 위한 Istio VirtualService
+_VIRTUAL_SERVICE = {
+    'apiVersion': 'networking.istio.io/v1beta1',
+    'kind': 'VirtualService',
+    'metadata': {
+        'name': 'milvus-ab-test',
+        'namespace': 'milvus-production'
+    },
+    'spec': {
+        'hosts': ['milvus.example.com'],
+        'http': [{
+            'match': [{
+                'headers': {
+                    'ab-test-group': {'exact': 'treatment'}
+                }
+            }],
+            'route': [{
+                'destination': {
+                    'host': 'milvus-treatment',
+                    'port': {'number': 19530}
+                }
+            }]
+        }, {
+            'route': [{
+                'destination': {
+                    'host': 'milvus-control',
+                    'port': {'number': 19530}
+                },
+                'weight': 50
+            }, {
+                'destination': {
+                    'host': 'milvus-treatment',
+                    'port': {'number': 19530}
+                },
+                'weight': 50
+            }]
+        }]
+    }
+}
+
+# ConfigMap for feature flags
+_FEATURE_FLAGS_CONFIG = {
+    'apiVersion': 'v1',
+    'kind': 'ConfigMap',
+    'metadata': {
+        'name': 'ab-test-config',
+        'namespace': 'milvus-production'
+    },
+    'data': {
+        'config.json': _FEATURE_FLAGS_JSON
+    }
+}
+
+# A/B 테스트 Grafana 대시보드 (고정 값이므로 한 번만 직렬화)
+_DASHBOARD_JSON = json.dumps({
+    'dashboard': {
+        'title': 'Milvus A/B Testing Dashboard',
+        'panels': [
+            {
+                'title': 'Response Time Comparison',
+                'type': 'graph',
+                'metrics': [
+                    'avg(milvus_request_duration_seconds{variant="control"})',
+                    'avg(milvus_request_duration_seconds{variant="treatment"})'
+                ]
+            },
+            {
+                'title': 'Throughput (QPS)',
+                'type': 'graph',
+                'metrics': [
+                    'rate(milvus_requests_total{variant="control"}[5m])',
+                    'rate(milvus_requests_total{variant="treatment"}[5m])'
+                ]
+            },
+            {
+                'title': 'Error Rate',
+                'type': 'graph',
+                'metrics': [
+                    'rate(milvus_errors_total{variant="control"}[5m])',
+                    'rate(milvus_errors_total{variant="treatment"}[5m])'
+                ]
+            },
+            {
+                'title': 'Memory Usage',
+                'type': 'graph',
+                'metrics': [
+                    'avg(milvus_memory_usage_bytes{variant="control"})',
+                    'avg(milvus_memory_usage_bytes{variant="treatment"})'
+                ]
+            }
+        ]
+    }
+}, indent=2).encode('utf-8')
+
 class TestVariant(Enum):
     """테스트 변형"""
     CONTROL = "A"  # 기존 버전
     TREATMENT = "B"  # 새 버전
 
+# TestMetrics.data 의 행 순서
+METRIC_NAMES = (
+    'response_time_ms',
+    'throughput_qps',
+    'error_rate',
+    'memory_usage_mb',
+    'cpu_usage_percent',
+    'search_accuracy',
+    'user_satisfaction',
+)
+METRIC_INDEX = {name: i for i, name in enumerate(METRIC_NAMES)}
+
+# 분석 대상 메트릭: (행 인덱스, 메트릭, 표시 이름, 개선 방향)
+ANALYZED_METRICS = tuple(
+    (METRIC_INDEX[metric_name], metric_name, display_name, direction)
+    for metric_name, display_name, direction in [
+        ('response_time_ms', '응답 시간 (ms)', 'lower_is_better'),
+        ('throughput_qps', '처리량 (QPS)', 'higher_is_better'),
+        ('error_rate', '오류율', 'lower_is_better'),
+        ('memory_usage_mb', '메모리 사용량 (MB)', 'lower_is_better'),
+        ('cpu_usage_percent', 'CPU 사용률 (%)', 'lower_is_better'),
+        ('search_accuracy', '검색 정확도', 'higher_is_better'),
+        ('user_satisfaction', '사용자 만족도', 'higher_is_better')
+    ]
+)
+
+# 트래픽 시뮬레이션 분포 (METRIC_NAMES 순서)
+# Treatment가 더 빠르고, 처리량/정확도/만족도가 높고, 오류/자원 사용이 적음
+_CONTROL_LOC = np.array([50, 1000, 0.005, 2048, 65, 0.94, 3.8], dtype=np.float32)
+_TREATMENT_LOC = np.array([40, 1200, 0.003, 1600, 60, 0.96, 4.2], dtype=np.float32)
+_METRIC_SCALE = np.array([10, 100, 0.002, 200, 10, 0.02, 0.3], dtype=np.float32)
+_METRIC_LOWER = np.array([10, 500, 0, 1000, 20, 0.8, 1.0], dtype=np.float32)
+_METRIC_UPPER = np.array([np.inf, np.inf, np.inf, np.inf, 100, 1.0, 5.0], dtype=np.float32)
+
 @dataclass
 class TestMetrics:
-    """테스트 메트릭"""
+    """테스트 메트릭 (행 = 메트릭, 열 = 샘플)"""
     variant: TestVariant
-    response_time_ms: List[float]
-    throughput_qps: List[float]
-    error_rate: List[float]
-    memory_usage_mb: List[float]
-    cpu_usage_percent: List[float]
-    search_accuracy: List[float]
-    user_satisfaction: List[float]
+    data: np.ndarray  # float32, shape: (len(METRIC_NAMES), sample_size)
     timestamp: datetime
 
 @dataclass
@@ -53,15 +195,227 @@ class ABTestConfig:
     confidence_level: float
     success_criteria: Dict[str, float]
 
+# A/B 테스트 시작 스크립트
+_START_SCRIPT = '''#!/bin/bash
+set -e
+
+GREEN='\\033[0;32m'
+YELLOW='\\033[1;33m'
+RED='\\033[0;31m'
+NC='\\033[0m'
+
+TEST_NAME=""
+TREATMENT_PERCENTAGE=50
+DURATION_MINUTES=30
+NAMESPACE="milvus-production"
+
+usage() {
+    echo "Usage: $0 -t TEST_NAME [-p PERCENTAGE] [-d DURATION] [-h]"
+    echo "  -t TEST_NAME    Name of the A/B test"
+    echo "  -p PERCENTAGE   Traffic percentage for treatment (default: 50)"
+    echo "  -d DURATION     Test duration in minutes (default: 30)"
+    echo "  -h              Show this help"
+    exit 1
+}
+
+while getopts "t:p:d:h" opt; do
+    case $opt in
+        t) TEST_NAME="$OPTARG" ;;
+        p) TREATMENT_PERCENTAGE="$OPTARG" ;;
+        d) DURATION_MINUTES="$OPTARG" ;;
+        h) usage ;;
+        *) usage ;;
+    esac
+done
+
+if [ -z "$TEST_NAME" ]; then
+    echo -e "${RED}Error: Test name is required${NC}"
+    usage
+fi
+
+echo -e "${GREEN}🧪 Starting A/B Test: $TEST_NAME${NC}"
+echo -e "Treatment Traffic: ${YELLOW}$TREATMENT_PERCENTAGE%${NC}"
+echo -e "Duration: ${YELLOW}$DURATION_MINUTES minutes${NC}"
+
+# Update traffic splitting
+CONTROL_PERCENTAGE=$((100 - TREATMENT_PERCENTAGE))
+
+kubectl patch virtualservice milvus-ab-test -n $NAMESPACE --type='merge' -p='{
+  "spec": {
+    "http": [{
+      "route": [{
+        "destination": {"host": "milvus-control"},
+        "weight": '$CONTROL_PERCENTAGE'
+      }, {
+        "destination": {"host": "milvus-treatment"},
+        "weight": '$TREATMENT_PERCENTAGE'
+      }]
+    }]
+  }
+}'
+
+echo -e "${GREEN}✅ A/B test started successfully${NC}"
+echo -e "Monitor progress: ./ab-test-monitor.sh -t $TEST_NAME"
+'''.encode('utf-8')
+
+# A/B 테스트 모니터링 스크립트
+_MONITOR_SCRIPT = '''#!/bin/bash
+
+GREEN='\\033[0;32m'
+YELLOW='\\033[1;33m'
+BLUE='\\033[0;34m'
+NC='\\033[0m'
+
+TEST_NAME=""
+NAMESPACE="milvus-production"
+
+usage() {
+    echo "Usage: $0 -t TEST_NAME [-h]"
+    echo "  -t TEST_NAME    Name of the A/B test to monitor"
+    echo "  -h              Show this help"
+    exit 1
+}
+
+while getopts "t:h" opt; do
+    case $opt in
+        t) TEST_NAME="$OPTARG" ;;
+        h) usage ;;
+        *) usage ;;
+    esac
+done
+
+if [ -z "$TEST_NAME" ]; then
+    echo -e "${RED}Error: Test name is required${NC}"
+    usage
+fi
+
+echo -e "${GREEN}📊 Monitoring A/B Test: $TEST_NAME${NC}"
+echo -e "${BLUE}Ctrl+C to stop monitoring${NC}"
+echo ""
+
+while true; do
+    echo -e "${YELLOW}$(date): Checking metrics...${NC}"
+    
+    # Get pod metrics
+    echo "Control Group (A):"
+    kubectl top pods -n $NAMESPACE -l variant=control | head -5
+    
+    echo ""
+    echo "Treatment Group (B):"
+    kubectl top pods -n $NAMESPACE -l variant=treatment | head -5
+    
+    echo ""
+    echo "Traffic Distribution:"
+    kubectl get virtualservice milvus-ab-test -n $NAMESPACE -o jsonpath='{.spec.http[0].route[*].weight}' | tr ' ' '\\n' | paste -d: <(echo -e "Control\\nTreatment") -
+    
+    echo ""
+    echo "----------------------------------------"
+    sleep 30
+done
+'''.encode('utf-8')
+
+# A/B 테스트 종료 스크립트
+_STOP_SCRIPT = '''#!/bin/bash
+set -e
+
+GREEN='\\033[0;32m'
+RED='\\033[0;31m'
+YELLOW='\\033[1;33m'
+NC='\\033[0m'
+
+TEST_NAME=""
+WINNER=""
+NAMESPACE="milvus-production"
+
+usage() {
+    echo "Usage: $0 -t TEST_NAME -w WINNER [-h]"
+    echo "  -t TEST_NAME    Name of the A/B test"
+    echo "  -w WINNER       Winner variant (control|treatment)"
+    echo "  -h              Show this help"
+    exit 1
+}
+
+while getopts "t:w:h" opt; do
+    case $opt in
+        t) TEST_NAME="$OPTARG" ;;
+        w) WINNER="$OPTARG" ;;
+        h) usage ;;
+        *) usage ;;
+    esac
+done
+
+if [ -z "$TEST_NAME" ] || [ -z "$WINNER" ]; then
+    echo -e "${RED}Error: Test name and winner are required${NC}"
+    usage
+fi
+
+echo -e "${GREEN}🏁 Stopping A/B Test: $TEST_NAME${NC}"
+echo -e "Winner: ${YELLOW}$WINNER${NC}"
+
+if [ "$WINNER" = "control" ]; then
+    # Route all traffic to control
+    kubectl patch virtualservice milvus-ab-test -n $NAMESPACE --type='merge' -p='{
+      "spec": {
+        "http": [{
+          "route": [{
+            "destination": {"host": "milvus-control"},
+            "weight": 100
+          }]
+        }]
+      }
+    }'
+    echo -e "${GREEN}✅ All traffic routed to control group${NC}"
+elif [ "$WINNER" = "treatment" ]; then
+    # Route all traffic to treatment
+    kubectl patch virtualservice milvus-ab-test -n $NAMESPACE --type='merge' -p='{
+      "spec": {
+        "http": [{
+          "route": [{
+            "destination": {"host": "milvus-treatment"},
+            "weight": 100
+          }]
+        }]
+      }
+    }'
+    echo -e "${GREEN}✅ All traffic routed to treatment group${NC}"
+else
+    echo -e "${RED}Error: Winner must be 'control' or 'treatment'${NC}"
+    exit 1
+fi
+
+echo -e "${GREEN}A/B test completed successfully${NC}"
+'''.encode('utf-8')
+
 class ABTestingManager:
     """A/B 테스팅 관리자"""
     
-    def __init__(self):
+    RESULTS_DIR = Path("ab-test-results")
+    MANIFESTS_DIR = Path("ab-test-manifests")
+    SCRIPTS_DIR = Path("ab-test-scripts")
+    
+    def __init__(self, seed: Optional[int] = None):
         self.tests: Dict[str, ABTestConfig] = {}
         self.metrics_data: Dict[str, List[TestMetrics]] = {}
         self.active_tests: Dict[str, bool] = {}
-        self.results_dir = Path("ab-test-results")
-        self.results_dir.mkdir(exist_ok=True)
+        self.results_dir = self.RESULTS_DIR
+        
+        # 디렉토리 생성
+        for directory in (self.RESULTS_DIR, self.MANIFESTS_DIR, self.SCRIPTS_DIR):
+            directory.mkdir(parents=True, exist_ok=True)
+        
+        # 스레드별 난수 생성기 (seed 지정 시 재현 가능한 결과)
+        self._seed_seq = np.random.SeedSequence(seed)
+        self._rng_lock = threading.Lock()
+        self._local = threading.local()
+    
+    def _rng(self) -> np.random.Generator:
+        """현재 스레드 전용 난수 생성기 반환"""
+        rng = getattr(self._local, 'rng', None)
+        if rng is None:
+            with self._rng_lock:
+                child_seed = self._seed_seq.spawn(1)[0]
+            rng = self._local.rng = np.random.default_rng(child_seed)
+        return rng
     
     def create_ab_test_config(self, test_name: str) -> ABTestConfig:
         """A/B 테스트 설정 생성"""
@@ -112,81 +466,14 @@ class ABTestingManager:
         print("🧪 A/B 테스트 환경 설정 중...")
         
         # Kubernetes 매니페스트 생성
-        manifests_dir = Path("ab-test-manifests")
-        manifests_dir.mkdir(exist_ok=True)
-        
-        # Traffic Splitting을 위한 Istio VirtualService
-        virtual_service = {
-            'apiVersion': 'networking.istio.io/v1beta1',
-            'kind': 'VirtualService',
-            'metadata': {
-                'name': 'milvus-ab-test',
-                'namespace': 'milvus-production'
-            },
-            'spec': {
-                'hosts': ['milvus.example.com'],
-                'http': [{
-                    'match': [{
-                        'headers': {
-                            'ab-test-group': {'exact': 'treatment'}
-                        }
-                    }],
-                    'route': [{
-                        'destination': {
-                            'host': 'milvus-treatment',
-                            'port': {'number': 19530}
-                        }
-                    }]
-                }, {
-                    'route': [{
-                        'destination': {
-                            'host': 'milvus-control',
-                            'port': {'number': 19530}
-                        },
-                        'weight': 50
-                    }, {
-                        'destination': {
-                            'host': 'milvus-treatment',
-                            'port': {'number': 19530}
-                        },
-                        'weight': 50
-                    }]
-                }]
-            }
-        }
-        
-        # ConfigMap for feature flags
-        feature_flags_config = {
-            'apiVersion': 'v1',
-            'kind': 'ConfigMap',
-            'metadata': {
-                'name': 'ab-test-config',
-                'namespace': 'milvus-production'
-            },
-            'data': {
-                'config.json': json.dumps({
-                    'ab_tests': {
-                        'search_algorithm': {
-                            'enabled': True,
-                            'treatment_percentage': 50,
-                            'feature_flags': {
-                                'use_hnsw': True,
-                                'optimize_memory': True
-                            }
-                        }
-                    }
-                }, indent=2)
-            }
-        }
+        manifests_dir = self.MANIFESTS_DIR
         
         # 매니페스트 저장
-        import yaml
-        
-        with open(manifests_dir / 'virtual-service.yaml', 'w') as f:
-            yaml.dump(virtual_service, f, default_flow_style=False)
+        (manifests_dir / 'virtual-service.yaml').write_bytes(
+            yaml.dump(_VIRTUAL_SERVICE, Dumper=YamlDumper, default_flow_style=False, encoding='utf-8'))
         
-        with open(manifests_dir / 'feature-flags-config.yaml', 'w') as f:
-            yaml.dump(feature_flags_config, f, default_flow_style=False)
+        (manifests_dir / 'feature-flags-config.yaml').write_bytes(
+            yaml.dump(_FEATURE_FLAGS_CONFIG, Dumper=YamlDumper, default_flow_style=False, encoding='utf-8'))
         
         print("  ✅ A/B 테스트 환경 매니페스트 생성됨")
         
@@ -197,110 +484,26 @@ class ABTestingManager:
         """A/B 테스트 대시보드 생성"""
         print("📊 A/B 테스트 대시보드 설정 중...")
         
-        dashboard_config = {
-            'dashboard': {
-                'title': 'Milvus A/B Testing Dashboard',
-                'panels': [
-                    {
-                        'title': 'Response Time Comparison',
-                        'type': 'graph',
-                        'metrics': [
-                            'avg(milvus_request_duration_seconds{variant="control"})',
-                            'avg(milvus_request_duration_seconds{variant="treatment"})'
-                        ]
-                    },
-                    {
-                        'title': 'Throughput (QPS)',
-                        'type': 'graph',
-                        'metrics': [
-                            'rate(milvus_requests_total{variant="control"}[5m])',
-                            'rate(milvus_requests_total{variant="treatment"}[5m])'
-                        ]
-                    },
-                    {
-                        'title': 'Error Rate',
-                        'type': 'graph',
-                        'metrics': [
-                            'rate(milvus_errors_total{variant="control"}[5m])',
-                            'rate(milvus_errors_total{variant="treatment"}[5m])'
-                        ]
-                    },
-                    {
-                        'title': 'Memory Usage',
-                        'type': 'graph',
-                        'metrics': [
-                            'avg(milvus_memory_usage_bytes{variant="control"})',
-                            'avg(milvus_memory_usage_bytes{variant="treatment"})'
-                        ]
-                    }
-                ]
-            }
-        }
-        
-        with open(self.results_dir / 'grafana-dashboard.json', 'w') as f:
-            json.dump(dashboard_config, f, indent=2)
+        (self.results_dir / 'grafana-dashboard.json').write_bytes(_DASHBOARD_JSON)
         
         print("  ✅ Grafana 대시보드 설정 생성됨")
     
     def simulate_test_traffic(self, config: ABTestConfig, variant: TestVariant) -> TestMetrics:
         """테스트 트래픽 시뮬레이션"""
         
-        # 시뮬레이션된 메트릭 생성
-        base_response_time = 50 if variant == TestVariant.CONTROL else 40  # Treatment가 더 빠름
-        base_throughput = 1000 if variant == TestVariant.CONTROL else 1200  # Treatment가 더 높음
-        base_error_rate = 0.005 if variant == TestVariant.CONTROL else 0.003  # Treatment가 더 낮음
-        base_memory = 2048 if variant == TestVariant.CONTROL else 1600  # Treatment가 더 적음
-        base_cpu = 65 if variant == TestVariant.CONTROL else 60  # Treatment가 더 낮음
-        base_accuracy = 0.94 if variant == TestVariant.CONTROL else 0.96  # Treatment가 더 높음
-        base_satisfaction = 3.8 if variant == TestVariant.CONTROL else 4.2  # Treatment가 더 높음
+        # 시뮬레이션된 메트릭 생성: loc + scale * N(0, 1) 을 메트릭 전체에 한 번에 적용
+        loc = _CONTROL_LOC if variant == TestVariant.CONTROL else _TREATMENT_LOC
         
         # 랜덤 변동 추가
         sample_size = min(config.sample_size, 100)  # 시뮬레이션을 위해 제한
-        
-        response_times = [
-            max(10, base_response_time + random.gauss(0, 10)) 
-            for _ in range(sample_size)
-        ]
-        
-        throughputs = [
-            max(500, base_throughput + random.gauss(0, 100)) 
-            for _ in range(sample_size)
-        ]
-        
-        error_rates = [
-            max(0, base_error_rate + random.gauss(0, 0.002)) 
-            for _ in range(sample_size)
-        ]
-        
-        memory_usages = [
-            max(1000, base_memory + random.gauss(0, 200)) 
-            for _ in range(sample_size)
-        ]
-        
-        cpu_usages = [
-            max(20, min(100, base_cpu + random.gauss(0, 10))) 
-            for _ in range(sample_size)
-        ]
-        
-        accuracies = [
-            max(0.8, min(1.0, base_accuracy + random.gauss(0, 0.02))) 
-            for _ in range(sample_size)
-        ]
-        
-        satisfactions = [
-            max(1.0, min(5.0, base_satisfaction + random.gauss(0, 0.3))) 
-            for _ in range(sample_size)
-        ]
+        samples = self._rng().standard_normal((len(METRIC_NAMES), sample_size), dtype=np.float32)
+        samples *= _METRIC_SCALE[:, None]
+        samples += loc[:, None]
+        np.clip(samples, _METRIC_LOWER[:, None], _METRIC_UPPER[:, None], out=samples)
         
         return TestMetrics(
             variant=variant,
-            response_time_ms=response_times,
-            throughput_qps=throughputs,
-            error_rate=error_rates,
-            memory_usage_mb=memory_usages,
-            cpu_usage_percent=cpu_usages,
-            search_accuracy=accuracies,
-            user_satisfaction=satisfactions,
+            data=samples,
             timestamp=datetime.now()
         )
     
@@ -335,26 +538,29 @@ class ABTestingManager:
                                            treatment_data: List[float]) -> Tuple[float, bool]:
         """통계적 유의성 계산 (간소화된 t-test)"""
         
-        if len(control_data) == 0 or len(treatment_data) == 0:
+        n_control = len(control_data)
+        n_treatment = len(treatment_data)
+        
+        if n_control == 0 or n_treatment == 0:
             return 0.0, False
         
-        mean_control = statistics.mean(control_data)
-        mean_treatment = statistics.mean(treatment_data)
+        mean_control = fsum(control_data) / n_control
+        mean_treatment = fsum(treatment_data) / n_treatment
         
-        if len(control_data) == 1 and len(treatment_data) == 1:
+        if n_control == 1 and n_treatment == 1:
             return 0.0, False
         
         # 간소화된 t-test 계산
         try:
-            var_control = statistics.variance(control_data) if len(control_data) > 1 else 0
-            var_treatment = statistics.variance(treatment_data) if len(treatment_data) > 1 else 0
+            var_control = fsum((x - mean_control) * (x - mean_control) for x in control_data) / (n_control - 1) if n_control > 1 else 0
+            var_treatment = fsum((x - mean_treatment) * (x - mean_treatment) for x in treatment_data) / (n_treatment - 1) if n_treatment > 1 else 0
             
-            pooled_std = ((var_control + var_treatment) / 2) ** 0.5
+            pooled_std = sqrt((var_control + var_treatment) / 2)
             
             if pooled_std == 0:
                 return 0.0, False
             
-            t_stat = abs(mean_treatment - mean_control) / (pooled_std * (1/len(control_data) + 1/len(treatment_data)) ** 0.5)
+            t_stat = abs(mean_treatment - mean_control) / (pooled_std * sqrt(1/n_control + 1/n_treatment))
             
             # 간소화된 p-value 계산 (실제로는 더 복잡한 계산 필요)
             p_value = max(0.001, 1 / (1 + t_stat))
@@ -363,7 +569,7 @@ class ABTestingManager:
             
             return p_value, is_significant
             
-        except (statistics.StatisticsError, ZeroDivisionError):
+        except ZeroDivisionError:
             return 0.0, False
     
     def analyze_test_results(self, test_name: str) -> Dict[str, Any]:
@@ -380,31 +586,26 @@ class ABTestingManager:
         
         results = {}
         
-        # 각 메트릭별 분석
-        metrics_to_analyze = [
-            ('response_time_ms', '응답 시간 (ms)', 'lower_is_better'),
-            ('throughput_qps', '처리량 (QPS)', 'higher_is_better'),
-            ('error_rate', '오류율', 'lower_is_better'),
-            ('memory_usage_mb', '메모리 사용량 (MB)', 'lower_is_better'),
-            ('cpu_usage_percent', 'CPU 사용률 (%)', 'lower_is_better'),
-            ('search_accuracy', '검색 정확도', 'higher_is_better'),
-            ('user_satisfaction', '사용자 만족도', 'higher_is_better')
-        ]
+        out = ["  📈 메트릭별 비교 결과:"]
         
-        print("  📈 메트릭별 비교 결과:")
+        # 모든 메트릭의 평균을 한 번에 계산 (누적은 float64)
+        control_means = control_metrics.data.mean(axis=1, dtype=np.float64)
+        treatment_means = treatment_metrics.data.mean(axis=1, dtype=np.float64)
         
-        for metric_name, display_name, direction in metrics_to_analyze:
-            control_data = getattr(control_metrics, metric_name)
-            treatment_data = getattr(treatment_metrics, metric_name)
+        # 각 메트릭별 분석
+        for row, metric_name, display_name, direction in ANALYZED_METRICS:
+            control_data = control_metrics.data[row]
+            treatment_data = treatment_metrics.data[row]
             
-            control_mean = statistics.mean(control_data)
-            treatment_mean = statistics.mean(treatment_data)
+            control_mean = float(control_means[row])
+            treatment_mean = float(treatment_means[row])
             
             improvement = ((treatment_mean - control_mean) / control_mean) * 100
             if direction == 'lower_is_better':
                 improvement = -improvement
             
-            p_value, is_significant = self.calculate_statistical_significance(control_data, treatment_data)
+            p_value, is_significant = self.calculate_statistical_significance(
+                control_data.tolist(), treatment_data.tolist())
             
             results[metric_name] = {
                 'control_mean': control_mean,
@@ -418,35 +619,37 @@ class ABTestingManager:
             significance_indicator = "✅" if is_significant else "⚠️"
             improvement_indicator = "📈" if improvement > 0 else "📉" if improvement < 0 else "➖"
             
-            print(f"    {significance_indicator} {display_name}:")
-            print(f"      A (Control): {control_mean:.2f}")
-            print(f"      B (Treatment): {treatment_mean:.2f}")
-            print(f"      {improvement_indicator} 변화: {improvement:+.1f}%")
-            print(f"      p-value: {p_value:.3f}")
+            out.append(f"    {significance_indicator} {display_name}:")
+            out.append(f"      A (Control): {control_mean:.2f}")
+            out.append(f"      B (Treatment): {treatment_mean:.2f}")
+            out.append(f"      {improvement_indicator} 변화: {improvement:+.1f}%")
+            out.append(f"      p-value: {p_value:.3f}")
         
         # 성공 기준 체크
-        print(f"\n  🎯 성공 기준 검증:")
+        out.append(f"\n  🎯 성공 기준 검증:")
         success_criteria_met = True
         
         for criterion, threshold in config.success_criteria.items():
             if criterion == 'response_time_improvement':
                 actual = results.get('response_time_ms', {}).get('improvement_percent', 0)
                 met = actual >= threshold * 100
-                print(f"    {'✅' if met else '❌'} 응답시간 개선: {actual:.1f}% (목표: {threshold*100:.1f}%)")
+                out.append(f"    {'✅' if met else '❌'} 응답시간 개선: {actual:.1f}% (목표: {threshold*100:.1f}%)")
                 success_criteria_met = success_criteria_met and met
                 
             elif criterion == 'accuracy_threshold':
                 actual = results.get('search_accuracy', {}).get('treatment_mean', 0)
                 met = actual >= threshold
-                print(f"    {'✅' if met else '❌'} 검색 정확도: {actual:.3f} (목표: {threshold:.3f})")
+                out.append(f"    {'✅' if met else '❌'} 검색 정확도: {actual:.3f} (목표: {threshold:.3f})")
                 success_criteria_met = success_criteria_met and met
                 
             elif criterion == 'error_rate_max':
                 actual = results.get('error_rate', {}).get('treatment_mean', 1)
                 met = actual <= threshold
-                print(f"    {'✅' if met else '❌'} 오류율: {actual:.3f} (최대: {threshold:.3f})")
+                out.append(f"    {'✅' if met else '❌'} 오류율: {actual:.3f} (최대: {threshold:.3f})")
                 success_criteria_met = success_criteria_met and met
         
+        sys.stdout.write("\n".join(out) + "\n")
+        
         results['success_criteria_met'] = success_criteria_met
         results['recommendation'] = self.generate_recommendation(results, success_criteria_met)
         
@@ -455,21 +658,24 @@ class ABTestingManager:
     def generate_recommendation(self, results: Dict[str, Any], criteria_met: bool) -> str:
         """테스트 결과 기반 권장사항 생성"""
         
+        # 메트릭 결과만 한 번 추려서 재사용
+        metric_results = [(metric, data) for metric, data in results.items() if isinstance(data, dict)]
+        
         if criteria_met:
-            significant_improvements = []
-            for metric, data in results.items():
-                if isinstance(data, dict) and data.get('is_significant') and data.get('improvement_percent', 0) > 5:
-                    significant_improvements.append(metric)
+            significant_improvements = [
+                metric for metric, data in metric_results
+                if data.get('is_significant') and data.get('improvement_percent', 0) > 5
+            ]
             
             if significant_improvements:
                 return "🚀 PROCEED: Treatment 버전을 프로덕션에 배포할 것을 권장합니다. 통계적으로 유의한 성능 개선이 확인되었습니다."
             else:
                 return "🤔 NEUTRAL: 성능 개선이 있지만 큰 차이는 없습니다. 다른 요인을 고려하여 결정하세요."
         else:
-            critical_failures = []
-            for metric, data in results.items():
-                if isinstance(data, dict) and data.get('improvement_percent', 0) < -10:
-                    critical_failures.append(metric)
+            critical_failures = [
+                metric for metric, data in metric_results
+                if data.get('improvement_percent', 0) < -10
+            ]
             
             if critical_failures:
                 return "🛑 STOP: Treatment 버전에 심각한 성능 저하가 있습니다. 추가 최적화 후 재테스트를 권장합니다."
@@ -479,7 +685,8 @@ class ABTestingManager:
     def save_test_results(self, test_name: str, results: Dict[str, Any]):
         """테스트 결과 저장"""
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         filename = f"{test_name}_{timestamp}.json"
         
         report = {
@@ -494,12 +701,12 @@ class ABTestingManager:
                 'success_criteria': self.tests[test_name].success_criteria
             },
             'results': results,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'recommendations': results.get('recommendation', '')
         }
         
-        with open(self.results_dir / filename, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        (self.results_dir / filename).write_bytes(
+            json.dumps(report, indent=2, default=str).encode('utf-8'))
         
         print(f"  💾 테스트 결과 저장: {filename}")
     
@@ -507,210 +714,19 @@ class ABTestingManager:
         """A/B 테스트 자동화 스크립트 생성"""
         print("📜 A/B 테스트 스크립트 생성 중...")
         
-        scripts_dir = Path("ab-test-scripts")
-        scripts_dir.mkdir(exist_ok=True)
-        
-        # A/B 테스트 시작 스크립트
-        start_script = '''#!/bin/bash
-set -e
-
-GREEN='\\033[0;32m'
-YELLOW='\\033[1;33m'
-RED='\\033[0;31m'
-NC='\\033[0m'
-
-TEST_NAME=""
-TREATMENT_PERCENTAGE=50
-DURATION_MINUTES=30
-NAMESPACE="milvus-production"
-
-usage() {
-    echo "Usage: $0 -t TEST_NAME [-p PERCENTAGE] [-d DURATION] [-h]"
-    echo "  -t TEST_NAME    Name of the A/B test"
-    echo "  -p PERCENTAGE   Traffic percentage for treatment (default: 50)"
-    echo "  -d DURATION     Test duration in minutes (default: 30)"
-    echo "  -h              Show this help"
-    exit 1
-}
-
-while getopts "t:p:d:h" opt; do
-    case $opt in
-        t) TEST_NAME="$OPTARG" ;;
-        p) TREATMENT_PERCENTAGE="$OPTARG" ;;
-        d) DURATION_MINUTES="$OPTARG" ;;
-        h) usage ;;
-        *) usage ;;
-    esac
-done
-
-if [ -z "$TEST_NAME" ]; then
-    echo -e "${RED}Error: Test name is required${NC}"
-    usage
-fi
-
-echo -e "${GREEN}🧪 Starting A/B Test: $TEST_NAME${NC}"
-echo -e "Treatment Traffic: ${YELLOW}$TREATMENT_PERCENTAGE%${NC}"
-echo -e "Duration: ${YELLOW}$DURATION_MINUTES minutes${NC}"
-
-# Update traffic splitting
-CONTROL_PERCENTAGE=$((100 - TREATMENT_PERCENTAGE))
-
-kubectl patch virtualservice milvus-ab-test -n $NAMESPACE --type='merge' -p='{
-  "spec": {
-    "http": [{
-      "route": [{
-        "destination": {"host": "milvus-control"},
-        "weight": '$CONTROL_PERCENTAGE'
-      }, {
-        "destination": {"host": "milvus-treatment"},
-        "weight": '$TREATMENT_PERCENTAGE'
-      }]
-    }]
-  }
-}'
-
-echo -e "${GREEN}✅ A/B test started successfully${NC}"
-echo -e "Monitor progress: ./ab-test-monitor.sh -t $TEST_NAME"
-'''
-        
-        # A/B 테스트 모니터링 스크립트
-        monitor_script = '''#!/bin/bash
-
-GREEN='\\033[0;32m'
-YELLOW='\\033[1;33m'
-BLUE='\\033[0;34m'
-NC='\\033[0m'
-
-TEST_NAME=""
-NAMESPACE="milvus-production"
-
-usage() {
-    echo "Usage: $0 -t TEST_NAME [-h]"
-    echo "  -t TEST_NAME    Name of the A/B test to monitor"
-    echo "  -h              Show this help"
-    exit 1
-}
-
-while getopts "t:h" opt; do
-    case $opt in
-        t) TEST_NAME="$OPTARG" ;;
-        h) usage ;;
-        *) usage ;;
-    esac
-done
-
-if [ -z "$TEST_NAME" ]; then
-    echo -e "${RED}Error: Test name is required${NC}"
-    usage
-fi
-
-echo -e "${GREEN}📊 Monitoring A/B Test: $TEST_NAME${NC}"
-echo -e "${BLUE}Ctrl+C to stop monitoring${NC}"
-echo ""
-
-while true; do
-    echo -e "${YELLOW}$(date): Checking metrics...${NC}"
-    
-    # Get pod metrics
-    echo "Control Group (A):"
-    kubectl top pods -n $NAMESPACE -l variant=control | head -5
-    
-    echo ""
-    echo "Treatment Group (B):"
-    kubectl top pods -n $NAMESPACE -l variant=treatment | head -5
-    
-    echo ""
-    echo "Traffic Distribution:"
-    kubectl get virtualservice milvus-ab-test -n $NAMESPACE -o jsonpath='{.spec.http[0].route[*].weight}' | tr ' ' '\\n' | paste -d: <(echo -e "Control\\nTreatment") -
-    
-    echo ""
-    echo "----------------------------------------"
-    sleep 30
-done
-'''
-        
-        # A/B 테스트 종료 스크립트
-        stop_script = '''#!/bin/bash
-set -e
-
-GREEN='\\033[0;32m'
-RED='\\033[0;31m'
-YELLOW='\\033[1;33m'
-NC='\\033[0m'
-
-TEST_NAME=""
-WINNER=""
-NAMESPACE="milvus-production"
-
-usage() {
-    echo "Usage: $0 -t TEST_NAME -w WINNER [-h]"
-    echo "  -t TEST_NAME    Name of the A/B test"
-    echo "  -w WINNER       Winner variant (control|treatment)"
-    echo "  -h              Show this help"
-    exit 1
-}
-
-while getopts "t:w:h" opt; do
-    case $opt in
-        t) TEST_NAME="$OPTARG" ;;
-        w) WINNER="$OPTARG" ;;
-        h) usage ;;
-        *) usage ;;
-    esac
-done
-
-if [ -z "$TEST_NAME" ] || [ -z "$WINNER" ]; then
-    echo -e "${RED}Error: Test name and winner are required${NC}"
-    usage
-fi
-
-echo -e "${GREEN}🏁 Stopping A/B Test: $TEST_NAME${NC}"
-echo -e "Winner: ${YELLOW}$WINNER${NC}"
-
-if [ "$WINNER" = "control" ]; then
-    # Route all traffic to control
-    kubectl patch virtualservice milvus-ab-test -n $NAMESPACE --type='merge' -p='{
-      "spec": {
-        "http": [{
-          "route": [{
-            "destination": {"host": "milvus-control"},
-            "weight": 100
-          }]
-        }]
-      }
-    }'
-    echo -e "${GREEN}✅ All traffic routed to control group${NC}"
-elif [ "$WINNER" = "treatment" ]; then
-    # Route all traffic to treatment
-    kubectl patch virtualservice milvus-ab-test -n $NAMESPACE --type='merge' -p='{
-      "spec": {
-        "http": [{
-          "route": [{
-            "destination": {"host": "milvus-treatment"},
-            "weight": 100
-          }]
-        }]
-      }
-    }'
-    echo -e "${GREEN}✅ All traffic routed to treatment group${NC}"
-else
-    echo -e "${RED}Error: Winner must be 'control' or 'treatment'${NC}"
-    exit 1
-fi
-
-echo -e "${GREEN}A/B test completed successfully${NC}"
-'''
+        scripts_dir = self.SCRIPTS_DIR
         
         # 스크립트 저장
         scripts = [
-            ('ab-test-start.sh', start_script),
-            ('ab-test-monitor.sh', monitor_script),
-            ('ab-test-stop.sh', stop_script)
+            ('ab-test-start.sh', _START_SCRIPT),
+            ('ab-test-monitor.sh', _MONITOR_SCRIPT),
+            ('ab-test-stop.sh', _STOP_SCRIPT)
         ]
         
         for filename, content in scripts:
-            with open(scripts_dir / filename, 'w') as f:
-                f.write(content)
+            script_path = scripts_dir / filename
+            script_path.write_bytes(content)
+            os.chmod(script_path, 0o755)
         
         print("  ✅ A/B 테스트 스크립트 생성 완료")
     
@@ -737,16 +753,14 @@ echo -e "${GREEN}A/B test completed successfully${NC}"
             print(f"\n💡 권장사항: {results.get('recommendation', '데이터 부족')}")
         
         # 종합 요약
-        print(f"\n{'='*80}")
-        print(" 🎯 A/B 테스트 종합 요약")
-        print("="*80)
+        out = [f"\n{'='*80}", " 🎯 A/B 테스트 종합 요약", "="*80]
         
         for scenario, results in all_results.items():
             config = self.tests[scenario]
             success = results.get('success_criteria_met', False)
             
-            print(f"\n📊 {config.name}:")
-            print(f"  결과: {'✅ 성공' if success else '❌ 실패'}")
+            out.append(f"\n📊 {config.name}:")
+            out.append(f"  결과: {'✅ 성공' if success else '❌ 실패'}")
             
             # 주요 개선사항 표시
             significant_improvements = []
@@ -756,9 +770,11 @@ echo -e "${GREEN}A/B test completed successfully${NC}"
                     significant_improvements.append(f"{metric}: {improvement:+.1f}%")
             
             if significant_improvements:
-                print(f"  주요 개선: {', '.join(significant_improvements[:3])}")
+                out.append(f"  주요 개선: {', '.join(significant_improvements[:3])}")
             else:
-                print(f"  주요 개선: 없음")
+                out.append(f"  주요 개선: 없음")
+        
+        sys.stdout.write("\n".join(out) + "\n")
 
 def main():
     """메인 실행 함수"""
@@ -15,12 +15,197 @@ import yaml
 import json
 import base64
 import hashlib
+import hmac
+import itertools
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Callable, Deque, Dict, List, Any, Mapping, Optional
 from enum import Enum
 import secrets
+import threading
 import uuid
+import numpy as np
+
+try:
+    from yaml import CSafeDumper as YamlDumper  # libyaml C 바인딩
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
+# 패스워드 해시 파라미터
+# 신규 해시는 메모리 하드 KDF인 scrypt ("scrypt$<salt>$<hash>") 를 사용한다.
+SCRYPT_PREFIX = 'scrypt$'
+SCRYPT_N = 2 ** 14  # CPU/메모리 비용 (128 * r * n = 16MB)
+SCRYPT_R = 8
+SCRYPT_P = 1
+SCRYPT_DKLEN = 32
+
+# 기존 PBKDF2 해시 ("<salt><hash>") 검증용 - 로그인 성공 시 scrypt로 재해시
+# hashlib.pbkdf2_hmac 은 OpenSSL(PKCS5_PBKDF2_HMAC)로 구현되어 있어
+# CPU가 지원하면 SHA 확장 명령(SHA-NI/ARMv8)을 자동으로 사용한다.
+PBKDF2_ALGORITHM = 'sha256'
+PBKDF2_ITERATIONS = 100000
+
+# 감사 로그 보관 한도 및 이벤트 공통 필드
+AUDIT_LOG_MAXLEN = 262144
+AUDIT_LOG_FILENAME = "audit_log.jsonl"  # security-configs 아래, 실행마다 이어서 기록
+AUDIT_IP_ADDRESS = "127.0.0.1"  # 시뮬레이션
+AUDIT_USER_AGENT = "MilvusClient/1.0"
+
+# API 키 지문 길이 (BLAKE2b digest 바이트)와 지문용 서버 비밀키 환경변수
+API_KEY_FINGERPRINT_BYTES = 16
+API_KEY_HASH_SECRET_ENV = "API_KEY_HASH_SECRET"
+
+# 보안 설정 출력 디렉토리
+SECURITY_DIR = "security-configs"
+SECURITY_SUBDIRS = ("certs", "rbac", "network-policies", "secrets")
+
+BAR = "=" * 80  # 섹션 구분선
+
+def _scrypt(password: str, salt: str) -> bytes:
+    """scrypt 키 유도"""
+    return hashlib.scrypt(password.encode('utf-8'),
+                          salt=salt.encode('utf-8'),
+                          n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P,
+                          dklen=SCRYPT_DKLEN)
+
+def _pbkdf2_sha256(password: str, salt: str) -> bytes:
+    """PBKDF2-HMAC-SHA256 키 유도"""
+    return hashlib.pbkdf2_hmac(PBKDF2_ALGORITHM,
+                               password.encode('utf-8'),
+                               salt.encode('utf-8'),
+                               PBKDF2_ITERATIONS)
+
+def _load_fingerprint_key() -> Optional[bytes]:
+    """API 키 지문용 서버 비밀키 (API_KEY_HASH_SECRET, 설정되지 않았으면 None)
+    
+    BLAKE2b 키는 최대 64바이트이므로 설정값은 32바이트 digest 로 정규화한다.
+    """
+    secret = os.getenv(API_KEY_HASH_SECRET_ENV)
+    if not secret:
+        return None
+    return hashlib.blake2b(secret.encode('utf-8'), digest_size=32).digest()
+
+def _api_key_fingerprint(api_key: str, key: bytes) -> str:
+    """API 키 지문 계산
+    
+    API 키는 256비트 난수라서 PBKDF2 같은 느린 KDF가 필요 없으므로
+    빠른 BLAKE2b 한 번으로 충분하다. 서버 비밀키로 keyed hash 를 만들어
+    지문 테이블이 유출돼도 오프라인으로 키를 대조할 수 없게 한다.
+    """
+    return hashlib.blake2b(api_key.encode('ascii'), digest_size=API_KEY_FINGERPRINT_BYTES,
+                           key=key).hexdigest()
+
+def _file_timestamp(dt: datetime) -> str:
+    """파일명용 타임스탬프 (YYYYMMDD_HHMMSS, 로캘을 거치는 strftime 대신 정수 포맷)"""
+    return f"{dt.year:04d}{dt.month:02d}{dt.day:02d}_{dt.hour:02d}{dt.minute:02d}{dt.second:02d}"
+
+def _b64encode_values(raw: Dict[str, bytes]) -> Dict[str, str]:
+    """Kubernetes Secret data 필드용 base64 인코딩"""
+    return {key: base64.b64encode(value).decode('ascii') for key, value in raw.items()}
+
+# 고정 시크릿 값 (import 시 한 번만 base64 인코딩)
+# 실제 환경에서는 실제 인증서를 base64 인코딩
+_TLS_SECRET_DATA = _b64encode_values({
+    'tls.crt': b'# TLS Certificate',
+    'tls.key': b'# TLS Private Key',
+    'ca.crt': b'# CA Certificate'
+})
+
+_DB_SECRET_DATA = _b64encode_values({
+    'username': b'milvus_admin',
+    'password': b'secure_password_123!',
+    'etcd-username': b'etcd_user',
+    'etcd-password': b'etcd_pass_456!',
+    'minio-access-key': b'milvus_access_key',
+    'minio-secret-key': b'milvus_secret_key_789!'
+})
+
+def _compile_permission_check(permissions: List[str]) -> Callable[[str], bool]:
+    """역할 권한 목록을 권한 체크 함수로 변환
+    
+    정확히 일치하는 권한은 frozenset, 와일드카드("resource:*")는 접두사 튜플로
+    미리 분리해 두어 호출 시에는 set 조회와 str.startswith 한 번만 수행한다.
+    """
+    exact = frozenset(p for p in permissions if not p.endswith(":*"))
+    prefixes = tuple(p[:-1] for p in permissions if p.endswith(":*"))
+    
+    if not prefixes:
+        return exact.__contains__
+    
+    def check(permission: str) -> bool:
+        return permission in exact or permission.startswith(prefixes)
+    
+    return check
+
+# TLS 인증서용 OpenSSL 설정 파일 (고정 내용이므로 import 시 한 번만 인코딩)
+_OPENSSL_CONFIG = '''[req]
+default_bits = 2048
+prompt = no
+default_md = sha256
+distinguished_name = dn
+req_extensions = v3_req
+
+[dn]
+C=KR
+ST=Seoul
+L=Seoul
+O=Milvus Production
+OU=Infrastructure
+CN=milvus.example.com
+
+[v3_req]
+basicConstraints = CA:FALSE
+keyUsage = nonRepudiation, digitalSignature, keyEncipherment
+subjectAltName = @alt_names
+
+[alt_names]
+DNS.1 = milvus.example.com
+DNS.2 = *.milvus.example.com
+DNS.3 = milvus-production.default.svc.cluster.local
+DNS.4 = localhost
+IP.1 = 127.0.0.1
+'''.encode('utf-8')
+
+# TLS 인증서 생성 스크립트
+_CERT_SCRIPT = '''#!/bin/bash
+set -e
+
+CERTS_DIR="security-configs/certs"
+cd $CERTS_DIR
+
+echo "🔑 Generating CA private key..."
+openssl genrsa -out ca-key.pem 4096
+
+echo "🏛️  Generating CA certificate..."
+openssl req -new -x509 -days 365 -key ca-key.pem -sha256 -out ca-cert.pem -subj "/C=KR/ST=Seoul/L=Seoul/O=Milvus CA/CN=Milvus CA"
+
+echo "🔑 Generating server private key..."
+openssl genrsa -out server-key.pem 4096
+
+echo "📄 Generating server certificate signing request..."
+openssl req -subj "/C=KR/ST=Seoul/L=Seoul/O=Milvus Production/CN=milvus.example.com" -sha256 -new -key server-key.pem -out server.csr
+
+echo "🏛️  Generating server certificate..."
+openssl x509 -req -days 365 -sha256 -in server.csr -CA ca-cert.pem -CAkey ca-key.pem -out server-cert.pem -extensions v3_req -extfile openssl.conf -CAcreateserial
+
+echo "🔑 Generating client private key..."
+openssl genrsa -out client-key.pem 4096
+
+echo "📄 Generating client certificate signing request..."
+openssl req -subj "/C=KR/ST=Seoul/L=Seoul/O=Milvus Client/CN=client" -new -key client-key.pem -out client.csr
+
+echo "🏛️  Generating client certificate..."
+openssl x509 -req -days 365 -sha256 -in client.csr -CA ca-cert.pem -CAkey ca-key.pem -out client-cert.pem -CAcreateserial
+
+echo "🧹 Cleaning up..."
+rm server.csr client.csr
+
+echo "✅ TLS certificates generated successfully!"
+echo "📁 Certificates location: $(pwd)"
+'''.encode('utf-8')
 
 class SecurityRole(Enum):
     """보안 역할"""
@@ -29,6 +214,18 @@ class SecurityRole(Enum):
     VIEWER = "viewer"
     SERVICE_ACCOUNT = "service_account"
 
+# 보안 상태 요약 출력 형식 (report["security_summary"] 키로 채움)
+_SUMMARY_TEMPLATE = (
+    "\n📈 보안 상태 요약:\n"
+    "  총 사용자: {total_users}명\n"
+    "  활성 사용자: {active_users}명\n"
+    "  발급된 API 키: {total_api_keys}개\n"
+    "  감사 로그: {total_audit_logs}건\n"
+)
+
+# 역할 -> 문자열 값 (Enum .value 디스크립터 조회를 반복하지 않도록 미리 계산)
+_ROLE_VALUES: Dict[SecurityRole, str] = {role: role.value for role in SecurityRole}
+
 class AuditAction(Enum):
     """감사 액션"""
     LOGIN = "login"
@@ -43,43 +240,59 @@ class AuditAction(Enum):
 class SecurityAuthManager:
     """보안 및 인증 관리자"""
     
-    def __init__(self):
+    def __init__(self, interactive: bool = True):
         self.namespace = "milvus-production"
-        self.security_dir = Path("security-configs")
-        self.certs_dir = Path("security-configs/certs")
-        self.audit_logs: List[Dict] = []
+        self.interactive = interactive  # 사람이 보는 시연일 때만 출력 간격을 둠
+        self.security_dir = Path(SECURITY_DIR)
+        self.certs_dir = self.security_dir / "certs"
+        # 실행마다 생성되는 보고서 경로 접두사 (문자열 결합 후 한 번만 Path 로 감쌈)
+        self._report_prefix = os.path.join(SECURITY_DIR, "security_report_")
+        self.audit_log_file = Path(SECURITY_DIR) / AUDIT_LOG_FILENAME  # 추가 전용 NDJSON 감사 로그
+        self.audit_logs: Deque[Dict] = deque(maxlen=AUDIT_LOG_MAXLEN)
+        self._audit_total = 0  # 지금까지 기록된 이벤트 수
+        self._audit_exported = 0  # 그중 파일로 내보낸 이벤트 수
+        
+        # API 키 지문용 서버 비밀키 (미설정 시 프로세스별 임시 키 - 재시작하면 기존 지문 검증 불가)
+        fingerprint_key = _load_fingerprint_key()
+        self._fingerprint_key_ephemeral = fingerprint_key is None
+        if fingerprint_key is None:
+            print(f"  ⚠️  {API_KEY_HASH_SECRET_ENV} 가 설정되지 않았습니다 - 임시 키로 API 키 지문을 만듭니다 "
+                  "(재시작 후 검증 불가, 지문은 시크릿에 저장하지 않음)")
+            fingerprint_key = secrets.token_bytes(32)
+        self._fingerprint_key = fingerprint_key
+        
+        # (사용자, 액션)별 누적 이벤트 수 - 보고서는 로그 전체를 다시 훑지 않음
+        self._user_action_counts: Counter = Counter()
+        
+        # 병렬 설정 단계의 진행 메시지 버퍼 (스레드별)
+        self._log_local = threading.local()
         
         # 디렉토리 생성
-        for directory in [self.security_dir, self.certs_dir]:
-            directory.mkdir(parents=True, exist_ok=True)
+        for subdir in SECURITY_SUBDIRS:
+            os.makedirs(os.path.join(SECURITY_DIR, subdir), exist_ok=True)
         
         # 기본 사용자 및 역할
-        self.users = {
-            "admin": {
-                "password_hash": self.hash_password("admin123!"),
-                "roles": [SecurityRole.ADMIN],
-                "api_keys": [],
-                "created_at": datetime.now(),
-                "last_login": None,
-                "active": True
-            },
-            "developer": {
-                "password_hash": self.hash_password("dev123!"),
-                "roles": [SecurityRole.DEVELOPER],
-                "api_keys": [],
-                "created_at": datetime.now(),
-                "last_login": None,
-                "active": True
-            },
-            "readonly": {
-                "password_hash": self.hash_password("read123!"),
-                "roles": [SecurityRole.VIEWER],
-                "api_keys": [],
-                "created_at": datetime.now(),
-                "last_login": None,
-                "active": True
-            }
-        }
+        default_users = [
+            ("admin", "admin123!", SecurityRole.ADMIN),
+            ("developer", "dev123!", SecurityRole.DEVELOPER),
+            ("readonly", "read123!", SecurityRole.VIEWER)
+        ]
+        
+        # scrypt는 해시 계산 중 GIL을 해제하므로 스레드로 병렬 처리
+        with ThreadPoolExecutor(max_workers=len(default_users)) as executor:
+            password_hashes = list(executor.map(
+                self.hash_password, [password for _, password, _ in default_users]))
+        
+        # 사용자 테이블 (Struct-of-Arrays): 컬럼별 배열 + username -> 행 인덱스
+        self._usernames: List[str] = [username for username, _, _ in default_users]
+        self._user_index: Dict[str, int] = {username: i for i, username in enumerate(self._usernames)}
+        self._password_hashes: List[str] = password_hashes
+        self._roles: List[List[SecurityRole]] = [[role] for _, _, role in default_users]
+        self._api_keys: List[List[Dict[str, Any]]] = [[] for _ in default_users]
+        created_at = datetime.now()
+        self._created_at: List[datetime] = [created_at] * len(default_users)
+        self._last_login = np.full(len(default_users), np.datetime64('NaT'), dtype='datetime64[us]')
+        self._active = np.ones(len(default_users), dtype=bool)
         
         self.role_permissions = {
             SecurityRole.ADMIN: [
@@ -97,31 +310,89 @@ class SecurityAuthManager:
                 "data:create", "data:read", "data:search"
             ]
         }
+        
+        # 역할별로 특화된 권한 체크 함수 (역할 권한 변경 시 다시 생성)
+        self._role_checks: Dict[SecurityRole, Callable[[str], bool]] = {
+            role: _compile_permission_check(perms)
+            for role, perms in self.role_permissions.items()
+        }
+    
+    @property
+    def users(self) -> Mapping[str, Mapping[str, Any]]:
+        """사용자별 정보 (읽기 전용 스냅샷, 대입 시 TypeError - 변경은 전용 메서드 사용)"""
+        return MappingProxyType({
+            username: MappingProxyType({
+                "password_hash": self._password_hashes[i],
+                "roles": tuple(self._roles[i]),
+                "api_keys": tuple(MappingProxyType(dict(key_info)) for key_info in self._api_keys[i]),
+                "created_at": self._created_at[i],
+                "last_login": self._last_login_at(i),
+                "active": bool(self._active[i])
+            })
+            for i, username in enumerate(self._usernames)
+        })
+    
+    def _last_login_at(self, i: int) -> Optional[datetime]:
+        """i번째 사용자의 마지막 로그인 시각"""
+        last_login = self._last_login[i]
+        return None if np.isnat(last_login) else last_login.item()
+    
+    def record_login(self, username: str):
+        """마지막 로그인 시각 갱신"""
+        self._last_login[self._user_index[username]] = np.datetime64(datetime.now(), 'us')
+    
+    def set_role_permissions(self, role: SecurityRole, permissions: List[str]):
+        """역할 권한 변경 (권한 체크 함수 재생성)"""
+        self.role_permissions[role] = permissions
+        self._role_checks[role] = _compile_permission_check(permissions)
+    
+    def has_permission(self, username: str, permission: str) -> bool:
+        """사용자 권한 확인 (와일드카드 포함)"""
+        role_checks = self._role_checks
+        return any(role_checks[role](permission) for role in self._roles[self._user_index[username]])
     
     def hash_password(self, password: str) -> str:
         """패스워드 해시화"""
         salt = secrets.token_hex(16)
-        pwdhash = hashlib.pbkdf2_hmac('sha256', 
-                                      password.encode('utf-8'), 
-                                      salt.encode('utf-8'), 
-                                      100000)
-        return salt + pwdhash.hex()
+        return f"{SCRYPT_PREFIX}{salt}${_scrypt(password, salt).hex()}"
     
     def verify_password(self, password: str, hashed: str) -> bool:
-        """패스워드 검증"""
-        salt = hashed[:32]
-        stored_hash = hashed[32:]
-        pwdhash = hashlib.pbkdf2_hmac('sha256',
-                                      password.encode('utf-8'),
-                                      salt.encode('utf-8'),
-                                      100000)
-        return pwdhash.hex() == stored_hash
+        """패스워드 검증 (scrypt 및 기존 PBKDF2 해시 지원)"""
+        if hashed.startswith(SCRYPT_PREFIX):
+            salt, _, stored_hex = hashed[len(SCRYPT_PREFIX):].partition('$')
+            derive = _scrypt
+        else:
+            salt, stored_hex = hashed[:32], hashed[32:]
+            derive = _pbkdf2_sha256
+        
+        try:
+            stored_hash = bytes.fromhex(stored_hex)
+        except ValueError:
+            return False
+        pwdhash = derive(password, salt)
+        # 상수 시간 비교 (타이밍 공격 방지)
+        return hmac.compare_digest(pwdhash, stored_hash)
+    
+    def authenticate(self, username: str, password: str) -> bool:
+        """사용자 인증 (기존 PBKDF2 해시는 성공 시 scrypt로 재해시)"""
+        if username not in self._user_index:
+            return False
+        
+        i = self._user_index[username]
+        hashed = self._password_hashes[i]
+        if not self.verify_password(password, hashed):
+            return False
+        
+        if not hashed.startswith(SCRYPT_PREFIX):
+            self._password_hashes[i] = self.hash_password(password)
+        return True
     
     def generate_api_key(self, user: str, description: str = "") -> str:
         """API 키 생성"""
         api_key = f"mk_{secrets.token_urlsafe(32)}"
         key_info = {
-            "key": api_key,
+            # 원본 키는 저장하지 않고 지문(fingerprint)만 보관
+            "fingerprint": _api_key_fingerprint(api_key, self._fingerprint_key),
             "user": user,
             "description": description,
             "created_at": datetime.now(),
@@ -129,8 +400,8 @@ class SecurityAuthManager:
             "active": True
         }
         
-        if user in self.users:
-            self.users[user]["api_keys"].append(key_info)
+        if user in self._user_index:
+            self._api_keys[self._user_index[user]].append(key_info)
         
         self.log_audit_event(user, AuditAction.MODIFY_SETTINGS, {
             "action": "api_key_created",
@@ -139,106 +410,72 @@ class SecurityAuthManager:
         
         return api_key
     
+    def verify_api_key(self, user: str, api_key: str) -> bool:
+        """API 키 검증 (저장된 지문과 상수 시간 비교)"""
+        if user not in self._user_index:
+            return False
+        
+        fingerprint = _api_key_fingerprint(api_key, self._fingerprint_key)
+        for key_info in self._api_keys[self._user_index[user]]:
+            if key_info["active"] and hmac.compare_digest(key_info["fingerprint"], fingerprint):
+                key_info["last_used"] = datetime.now()
+                return True
+        return False
+    
     def log_audit_event(self, user: str, action: AuditAction, details: Dict[str, Any]):
         """감사 로그 기록"""
+        action_value = action.value
+        self._user_action_counts[(user, action_value)] += 1
+        
+        self._audit_total += 1
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "ts_ns": time.time_ns(),  # epoch 나노초, 직렬화 시점에 ISO 형식으로 변환
             "user": user,
-            "action": action.value,
+            "action": action_value,
             "details": details,
-            "ip_address": "127.0.0.1",  # 시뮬레이션
-            "user_agent": "MilvusClient/1.0",
+            "ip_address": AUDIT_IP_ADDRESS,
+            "user_agent": AUDIT_USER_AGENT,
             "session_id": str(uuid.uuid4())
         }
         
         self.audit_logs.append(log_entry)
         
         # 실제 환경에서는 외부 로그 시스템에 전송
-        print(f"  🔍 감사로그: {user} - {action.value}")
+        print(f"  🔍 감사로그: {user} - {action_value}")
+    
+    def _log(self, message: str):
+        """진행 메시지 출력 (run_buffered 안에서는 스레드별 버퍼에 모음)"""
+        lines = getattr(self._log_local, 'lines', None)
+        if lines is None:
+            print(message)
+        else:
+            lines.append(message)
+    
+    def run_buffered(self, step: Callable[[], Any]) -> str:
+        """설정 단계를 실행하고 그동안의 진행 메시지를 한 덩어리로 반환"""
+        self._log_local.lines = lines = []
+        try:
+            step()
+        finally:
+            self._log_local.lines = None
+        return "".join(f"{line}\n" for line in lines)
     
     def create_tls_certificates(self):
         """TLS 인증서 생성"""
-        print("🔐 TLS 인증서 설정 생성 중...")
+        self._log("🔐 TLS 인증서 설정 생성 중...")
         
         # OpenSSL 설정 파일
-        openssl_config = '''[req]
-default_bits = 2048
-prompt = no
-default_md = sha256
-distinguished_name = dn
-req_extensions = v3_req
-
-[dn]
-C=KR
-ST=Seoul
-L=Seoul
-O=Milvus Production
-OU=Infrastructure
-CN=milvus.example.com
-
-[v3_req]
-basicConstraints = CA:FALSE
-keyUsage = nonRepudiation, digitalSignature, keyEncipherment
-subjectAltName = @alt_names
-
-[alt_names]
-DNS.1 = milvus.example.com
-DNS.2 = *.milvus.example.com
-DNS.3 = milvus-production.default.svc.cluster.local
-DNS.4 = localhost
-IP.1 = 127.0.0.1
-'''
-        
-        with open(self.certs_dir / 'openssl.conf', 'w') as f:
-            f.write(openssl_config)
+        (self.certs_dir / 'openssl.conf').write_bytes(_OPENSSL_CONFIG)
         
         # 인증서 생성 스크립트
-        cert_script = '''#!/bin/bash
-set -e
-
-CERTS_DIR="security-configs/certs"
-cd $CERTS_DIR
-
-echo "🔑 Generating CA private key..."
-openssl genrsa -out ca-key.pem 4096
-
-echo "🏛️  Generating CA certificate..."
-openssl req -new -x509 -days 365 -key ca-key.pem -sha256 -out ca-cert.pem -subj "/C=KR/ST=Seoul/L=Seoul/O=Milvus CA/CN=Milvus CA"
-
-echo "🔑 Generating server private key..."
-openssl genrsa -out server-key.pem 4096
-
-echo "📄 Generating server certificate signing request..."
-openssl req -subj "/C=KR/ST=Seoul/L=Seoul/O=Milvus Production/CN=milvus.example.com" -sha256 -new -key server-key.pem -out server.csr
-
-echo "🏛️  Generating server certificate..."
-openssl x509 -req -days 365 -sha256 -in server.csr -CA ca-cert.pem -CAkey ca-key.pem -out server-cert.pem -extensions v3_req -extfile openssl.conf -CAcreateserial
-
-echo "🔑 Generating client private key..."
-openssl genrsa -out client-key.pem 4096
-
-echo "📄 Generating client certificate signing request..."
-openssl req -subj "/C=KR/ST=Seoul/L=Seoul/O=Milvus Client/CN=client" -new -key client-key.pem -out client.csr
-
-echo "🏛️  Generating client certificate..."
-openssl x509 -req -days 365 -sha256 -in client.csr -CA ca-cert.pem -CAkey ca-key.pem -out client-cert.pem -CAcreateserial
-
-echo "🧹 Cleaning up..."
-rm server.csr client.csr
-
-echo "✅ TLS certificates generated successfully!"
-echo "📁 Certificates location: $(pwd)"
-'''
-        
-        with open(self.security_dir / 'generate-certs.sh', 'w') as f:
-            f.write(cert_script)
+        (self.security_dir / 'generate-certs.sh').write_bytes(_CERT_SCRIPT)
         
-        print("  ✅ TLS 인증서 생성 스크립트 작성됨")
-        print("  💫 실행 명령: chmod +x security-configs/generate-certs.sh && ./security-configs/generate-certs.sh")
+        self._log("  ✅ TLS 인증서 생성 스크립트 작성됨")
+        self._log("  💫 실행 명령: chmod +x security-configs/generate-certs.sh && ./security-configs/generate-certs.sh")
     
     def create_rbac_configuration(self):
         """RBAC 설정 생성"""
-        print("👥 RBAC 권한 관리 설정 중...")
+        self._log("👥 RBAC 권한 관리 설정 중...")
         
         # Kubernetes RBAC 설정
         rbac_manifests = []
@@ -252,7 +489,7 @@ echo "📁 Certificates location: $(pwd)"
                 'namespace': self.namespace
             }
         }
-        rbac_manifests.append(('service-account.yaml', service_account))
+        rbac_manifests.append(service_account)
         
         # ClusterRole
         cluster_role = {
@@ -279,7 +516,7 @@ echo "📁 Certificates location: $(pwd)"
                 }
             ]
         }
-        rbac_manifests.append(('cluster-role.yaml', cluster_role))
+        rbac_manifests.append(cluster_role)
         
         # ClusterRoleBinding
         cluster_role_binding = {
@@ -299,7 +536,7 @@ echo "📁 Certificates location: $(pwd)"
                 'namespace': self.namespace
             }]
         }
-        rbac_manifests.append(('cluster-role-binding.yaml', cluster_role_binding))
+        rbac_manifests.append(cluster_role_binding)
         
         # Role for namespace-specific operations
         role = {
@@ -322,7 +559,7 @@ echo "📁 Certificates location: $(pwd)"
                 }
             ]
         }
-        rbac_manifests.append(('developer-role.yaml', role))
+        rbac_manifests.append(role)
         
         # RoleBinding
         role_binding = {
@@ -343,45 +580,45 @@ echo "📁 Certificates location: $(pwd)"
                 'apiGroup': 'rbac.authorization.k8s.io'
             }
         }
-        rbac_manifests.append(('developer-role-binding.yaml', role_binding))
+        rbac_manifests.append(role_binding)
         
         # RBAC 매니페스트 저장
         rbac_dir = self.security_dir / "rbac"
-        rbac_dir.mkdir(exist_ok=True)
         
-        for filename, manifest in rbac_manifests:
-            with open(rbac_dir / filename, 'w') as f:
-                yaml.dump(manifest, f, default_flow_style=False)
+        # 모든 매니페스트를 하나의 multi-document YAML로 저장
+        (rbac_dir / 'rbac.yaml').write_bytes(
+            yaml.dump_all(rbac_manifests, Dumper=YamlDumper, default_flow_style=False, encoding='utf-8'))
         
-        print("  ✅ Kubernetes RBAC 설정 생성됨")
+        self._log("  ✅ Kubernetes RBAC 설정 생성됨")
         
-        # Milvus 사용자 권한 설정
+        # Milvus 사용자 권한 설정 (모든 값이 JSON 기본 타입이므로 default 변환 불필요)
         user_permissions = {
-            'users': {},
-            'roles': {}
-        }
-        
-        for username, user_info in self.users.items():
-            user_permissions['users'][username] = {
-                'roles': [role.value for role in user_info['roles']],
-                'active': user_info['active'],
-                'created_at': user_info['created_at'].isoformat()
-            }
-        
-        for role, permissions in self.role_permissions.items():
-            user_permissions['roles'][role.value] = {
-                'permissions': permissions,
-                'description': f"Role for {role.value} access level"
+            'users': {
+                username: {
+                    'roles': [_ROLE_VALUES[role] for role in roles],
+                    'active': bool(active),
+                    'created_at': created_at.isoformat()
+                }
+                for username, roles, active, created_at in zip(
+                    self._usernames, self._roles, self._active, self._created_at)
+            },
+            'roles': {
+                role.value: {
+                    'permissions': permissions,
+                    'description': f"Role for {role.value} access level"
+                }
+                for role, permissions in self.role_permissions.items()
             }
+        }
         
-        with open(self.security_dir / 'user-permissions.json', 'w') as f:
-            json.dump(user_permissions, f, indent=2, default=str)
+        (self.security_dir / 'user-permissions.json').write_bytes(
+            json.dumps(user_permissions, indent=2).encode('utf-8'))
         
-        print("  ✅ Milvus 사용자 권한 설정 생성됨")
+        self._log("  ✅ Milvus 사용자 권한 설정 생성됨")
     
     def create_network_policies(self):
         """네트워크 보안 정책 생성"""
-        print("🌐 네트워크 보안 정책 설정 중...")
+        self._log("🌐 네트워크 보안 정책 설정 중...")
         
         # 기본 네트워크 정책 (모든 트래픽 차단)
         default_deny = {
@@ -513,24 +750,18 @@ echo "📁 Certificates location: $(pwd)"
         }
         
         # 네트워크 정책 저장
-        network_policies = [
-            ('default-deny-all.yaml', default_deny),
-            ('milvus-allow-traffic.yaml', milvus_allow),
-            ('admin-access.yaml', admin_access)
-        ]
+        network_policies = [default_deny, milvus_allow, admin_access]
         
         network_dir = self.security_dir / "network-policies"
-        network_dir.mkdir(exist_ok=True)
         
-        for filename, policy in network_policies:
-            with open(network_dir / filename, 'w') as f:
-                yaml.dump(policy, f, default_flow_style=False)
+        (network_dir / 'network-policies.yaml').write_bytes(
+            yaml.dump_all(network_policies, Dumper=YamlDumper, default_flow_style=False, encoding='utf-8'))
         
-        print("  ✅ 네트워크 보안 정책 생성됨")
+        self._log("  ✅ 네트워크 보안 정책 생성됨")
     
     def create_secrets_management(self):
         """시크릿 관리 설정"""
-        print("🔑 시크릿 관리 시스템 설정 중...")
+        self._log("🔑 시크릿 관리 시스템 설정 중...")
         
         # Kubernetes Secrets
         secrets = []
@@ -544,14 +775,9 @@ echo "📁 Certificates location: $(pwd)"
                 'namespace': self.namespace
             },
             'type': 'kubernetes.io/tls',
-            'data': {
-                # 실제 환경에서는 실제 인증서를 base64 인코딩
-                'tls.crt': base64.b64encode(b'# TLS Certificate').decode('utf-8'),
-                'tls.key': base64.b64encode(b'# TLS Private Key').decode('utf-8'),
-                'ca.crt': base64.b64encode(b'# CA Certificate').decode('utf-8')
-            }
+            'data': _TLS_SECRET_DATA
         }
-        secrets.append(('milvus-tls-secret.yaml', tls_secret))
+        secrets.append(tls_secret)
         
         # Database Credentials
         db_secret = {
@@ -562,24 +788,20 @@ echo "📁 Certificates location: $(pwd)"
                 'namespace': self.namespace
             },
             'type': 'Opaque',
-            'data': {
-                'username': base64.b64encode(b'milvus_admin').decode('utf-8'),
-                'password': base64.b64encode(b'secure_password_123!').decode('utf-8'),
-                'etcd-username': base64.b64encode(b'etcd_user').decode('utf-8'),
-                'etcd-password': base64.b64encode(b'etcd_pass_456!').decode('utf-8'),
-                'minio-access-key': base64.b64encode(b'milvus_access_key').decode('utf-8'),
-                'minio-secret-key': base64.b64encode(b'milvus_secret_key_789!').decode('utf-8')
-            }
+            'data': _DB_SECRET_DATA
         }
-        secrets.append(('milvus-db-credentials.yaml', db_secret))
-        
-        # API Keys Secret
-        api_keys_data = {}
-        for username, user_info in self.users.items():
-            if user_info['api_keys']:
-                api_keys_data[f'{username}-api-key'] = base64.b64encode(
-                    user_info['api_keys'][0]['key'].encode('utf-8')
-                ).decode('utf-8')
+        secrets.append(db_secret)
+        
+        # API Keys Secret (임시 키로 만든 지문은 재시작 후 쓸모가 없으므로 기록하지 않음)
+        if self._fingerprint_key_ephemeral:
+            api_keys_data = {}
+            self._log(f"  ⚠️  {API_KEY_HASH_SECRET_ENV} 미설정: API 키 지문을 secrets.yaml 에 기록하지 않음")
+        else:
+            api_keys_data = _b64encode_values({
+                f'{username}-api-key-fingerprint': api_keys[0]['fingerprint'].encode('ascii')
+                for username, api_keys in zip(self._usernames, self._api_keys)
+                if api_keys
+            })
         
         api_secret = {
             'apiVersion': 'v1',
@@ -591,15 +813,13 @@ echo "📁 Certificates location: $(pwd)"
             'type': 'Opaque',
             'data': api_keys_data
         }
-        secrets.append(('milvus-api-keys.yaml', api_secret))
+        secrets.append(api_secret)
         
         # Secrets 저장
         secrets_dir = self.security_dir / "secrets"
-        secrets_dir.mkdir(exist_ok=True)
         
-        for filename, secret in secrets:
-            with open(secrets_dir / filename, 'w') as f:
-                yaml.dump(secret, f, default_flow_style=False)
+        (secrets_dir / 'secrets.yaml').write_bytes(
+            yaml.dump_all(secrets, Dumper=YamlDumper, default_flow_style=False, encoding='utf-8'))
         
         # Vault 설정 (시뮬레이션)
         vault_config = {
@@ -618,14 +838,14 @@ echo "📁 Certificates location: $(pwd)"
             }
         }
         
-        with open(self.security_dir / 'vault-config.yaml', 'w') as f:
-            yaml.dump(vault_config, f, default_flow_style=False)
+        (self.security_dir / 'vault-config.yaml').write_bytes(
+            yaml.dump(vault_config, Dumper=YamlDumper, default_flow_style=False, encoding='utf-8'))
         
-        print("  ✅ 시크릿 관리 설정 생성됨")
+        self._log("  ✅ 시크릿 관리 설정 생성됨")
     
     def create_security_monitoring(self):
         """보안 모니터링 설정"""
-        print("🔍 보안 모니터링 시스템 설정 중...")
+        self._log("🔍 보안 모니터링 시스템 설정 중...")
         
         # Falco 규칙 (런타임 보안)
         falco_rules = '''# Milvus Security Rules
@@ -700,8 +920,10 @@ echo "📁 Certificates location: $(pwd)"
             ]
         }
         
-        with open(self.security_dir / 'security-monitoring.yaml', 'w') as f:
-            yaml.dump(security_metrics, f, default_flow_style=False)
+        # 스트림에 조각조각 쓰지 않고 한 번에 인코딩해 단일 write
+        (self.security_dir / 'security-monitoring.yaml').write_bytes(
+            yaml.dump(security_metrics, Dumper=YamlDumper, default_flow_style=False, encoding='utf-8')
+        )
         
         # 보안 알림 규칙
         alert_rules = '''groups:
@@ -747,7 +969,7 @@ echo "📁 Certificates location: $(pwd)"
         with open(self.security_dir / 'security-alerts.yml', 'w') as f:
             f.write(alert_rules)
         
-        print("  ✅ 보안 모니터링 설정 생성됨")
+        self._log("  ✅ 보안 모니터링 설정 생성됨")
     
     def simulate_security_operations(self):
         """보안 운영 시뮬레이션"""
@@ -762,15 +984,20 @@ echo "📁 Certificates location: $(pwd)"
             ("hacker", "wrongpass", False)
         ]
         
-        for username, password, should_succeed in test_users:
-            if username in self.users:
-                success = self.verify_password(password, self.users[username]["password_hash"])
+        # KDF 계산은 GIL을 해제하므로 모든 인증을 스레드로 한 번에 수행
+        with ThreadPoolExecutor(max_workers=min(len(test_users), os.cpu_count() or 1)) as executor:
+            auth_results = list(executor.map(self.authenticate,
+                                             [username for username, _, _ in test_users],
+                                             [password for _, password, _ in test_users]))
+        
+        for (username, password, should_succeed), success in zip(test_users, auth_results):
+            if username in self._user_index:
                 result = "✅ 성공" if success else "❌ 실패"
                 expected = "예상됨" if success == should_succeed else "예상과 다름"
                 print(f"  {username}: {result} ({expected})")
                 
                 if success:
-                    self.users[username]["last_login"] = datetime.now()
+                    self.record_login(username)
                     self.log_audit_event(username, AuditAction.LOGIN, {"method": "password"})
             else:
                 print(f"  {username}: ❌ 실패 (사용자 없음)")
@@ -779,7 +1006,8 @@ echo "📁 Certificates location: $(pwd)"
         print(f"\n🔑 API 키 관리 테스트:")
         for username in ["admin", "developer"]:
             api_key = self.generate_api_key(username, f"{username} production key")
-            print(f"  {username} API 키: {api_key[:20]}...")
+            verified = "✅ 검증됨" if self.verify_api_key(username, api_key) else "❌ 검증 실패"
+            print(f"  {username} API 키: {api_key[:20]}... ({verified})")
         
         # 3. 권한 체크 시뮬레이션
         print(f"\n🛡️  권한 체크 테스트:")
@@ -791,24 +1019,15 @@ echo "📁 Certificates location: $(pwd)"
         ]
         
         for username, permission, should_allow in permission_tests:
-            if username in self.users:
-                user_roles = self.users[username]["roles"]
-                allowed = any(
-                    permission in self.role_permissions[role] or 
-                    any(perm.endswith(":*") and permission.startswith(perm[:-1]) 
-                        for perm in self.role_permissions[role])
-                    for role in user_roles
-                )
+            if username in self._user_index:
+                allowed = self.has_permission(username, permission)
                 result = "✅ 허용" if allowed else "❌ 거부"
                 expected = "예상됨" if allowed == should_allow else "예상과 다름"
                 print(f"  {username} - {permission}: {result} ({expected})")
         
         # 4. 감사 로그 요약
         print(f"\n📋 감사 로그 요약:")
-        action_counts = {}
-        for log in self.audit_logs:
-            action = log["action"]
-            action_counts[action] = action_counts.get(action, 0) + 1
+        action_counts = self._aggregate_action_counts()
         
         for action, count in action_counts.items():
             print(f"  {action}: {count}회")
@@ -825,19 +1044,41 @@ echo "📁 Certificates location: $(pwd)"
         for event, severity, description in security_events:
             severity_emoji = {"CRITICAL": "🔴", "WARNING": "🟡", "INFO": "🔵"}.get(severity, "⚪")
             print(f"  {severity_emoji} [{severity}] {event}: {description}")
-            time.sleep(0.3)
+            if self.interactive:
+                time.sleep(0.3)
     
-    def generate_security_report(self):
-        """보안 상태 보고서 생성"""
+    def _aggregate_action_counts(self) -> Counter:
+        """(사용자, 액션) 카운터를 한 번 순회하여 액션별 합계 계산"""
+        per_action = Counter()
+        for (_, action), count in self._user_action_counts.items():
+            per_action[action] += count
+        return per_action
+    
+    def export_audit_log(self, path: Path) -> int:
+        """아직 내보내지 않은 감사 이벤트를 NDJSON(한 줄에 하나)으로 파일 끝에 추가하고 그 수를 반환"""
+        pending = min(self._audit_total - self._audit_exported, len(self.audit_logs))
+        start = len(self.audit_logs) - pending
+        with open(path, 'ab', buffering=1 << 16) as f:
+            for entry in itertools.islice(self.audit_logs, start, None):
+                record = {"timestamp": datetime.fromtimestamp(entry["ts_ns"] / 1e9).isoformat()}
+                record.update(entry)
+                del record["ts_ns"]
+                f.write(json.dumps(record, default=str).encode('utf-8') + b"\n")
+        self._audit_exported = self._audit_total
+        return pending
+    
+    def generate_security_report(self, run_at: Optional[datetime] = None):
+        """보안 상태 보고서 생성 (run_at: 실행 시각, 모든 산출물이 같은 시각을 공유)"""
         print("\n📊 보안 상태 보고서 생성 중...")
+        run_at = run_at or datetime.now()
         
         report = {
-            "report_date": datetime.now().isoformat(),
+            "report_date": run_at.isoformat(),
             "security_summary": {
-                "total_users": len(self.users),
-                "active_users": sum(1 for u in self.users.values() if u["active"]),
-                "total_api_keys": sum(len(u["api_keys"]) for u in self.users.values()),
-                "total_audit_logs": len(self.audit_logs)
+                "total_users": len(self._usernames),
+                "active_users": int(self._active.sum()),
+                "total_api_keys": sum(map(len, self._api_keys)),
+                "total_audit_logs": self._audit_total
             },
             "user_activity": {},
             "security_configurations": {
@@ -862,153 +1103,144 @@ echo "📁 Certificates location: $(pwd)"
             ]
         }
         
-        # 사용자별 활동 요약
-        for username, user_info in self.users.items():
-            user_logs = [log for log in self.audit_logs if log["user"] == username]
-            report["user_activity"][username] = {
-                "last_login": user_info["last_login"].isoformat() if user_info["last_login"] else None,
-                "total_actions": len(user_logs),
-                "roles": [role.value for role in user_info["roles"]],
-                "api_keys_count": len(user_info["api_keys"])
+        # 사용자별 활동 요약 ((사용자, 액션) 카운터에서 사용자별 합계 계산)
+        user_action_totals = Counter()
+        for (user, _), count in self._user_action_counts.items():
+            user_action_totals[user] += count
+        
+        last_logins = map(self._last_login_at, range(len(self._usernames)))
+        report["user_activity"] = {
+            username: {
+                "last_login": last_login.isoformat() if last_login else None,
+                "total_actions": user_action_totals[username],
+                "roles": [_ROLE_VALUES[role] for role in roles],
+                "api_keys_count": len(api_keys)
             }
+            for username, last_login, roles, api_keys
+            in zip(self._usernames, last_logins, self._roles, self._api_keys)
+        }
+        
+        # 감사 로그는 보고서 본문에 넣지 않고 NDJSON 파일 끝에 추가한 뒤 경로만 기록
+        timestamp = _file_timestamp(run_at)
+        audit_log_file = self.audit_log_file
+        self.export_audit_log(audit_log_file)
+        report["audit_log_file"] = audit_log_file.name
         
         # 보고서 저장
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        report_file = self.security_dir / f"security_report_{timestamp}.json"
+        report_file = Path(self._report_prefix + timestamp + ".json")
         
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        # 디스크에는 compact JSON (indent 없이 C 인코더 사용, 사람이 볼 때는 python -m json.tool)
+        report_file.write_bytes(json.dumps(report, separators=(',', ':'), default=str).encode('utf-8'))
         
+        print(f"  ✅ 감사 로그 저장됨: {audit_log_file.name}")
         print(f"  ✅ 보안 보고서 저장됨: {report_file.name}")
         
         # 요약 출력
-        print(f"\n📈 보안 상태 요약:")
-        print(f"  총 사용자: {report['security_summary']['total_users']}명")
-        print(f"  활성 사용자: {report['security_summary']['active_users']}명")
-        print(f"  발급된 API 키: {report['security_summary']['total_api_keys']}개")
-        print(f"  감사 로그: {report['security_summary']['total_audit_logs']}건")
+        sys.stdout.write(_SUMMARY_TEMPLATE.format_map(report["security_summary"]))
         
         return report
 
+# 실행 요약에 출력하는 고정 목록
+_SECURITY_RESOURCES = (
+    "security-configs/generate-certs.sh",
+    "security-configs/openssl.conf",
+    "security-configs/rbac/rbac.yaml",
+    "security-configs/network-policies/network-policies.yaml",
+    "security-configs/secrets/secrets.yaml",
+    "security-configs/vault-config.yaml",
+    "security-configs/falco-rules.yaml",
+    "security-configs/security-monitoring.yaml",
+    "security-configs/user-permissions.json",
+    f"{SECURITY_DIR}/{AUDIT_LOG_FILENAME}",
+)
+
+_SECURITY_FEATURES = (
+    "✅ TLS/SSL 암호화 통신",
+    "✅ RBAC 역할 기반 접근 제어",
+    "✅ API 키 인증 시스템",
+    "✅ 네트워크 정책 기반 격리",
+    "✅ 시크릿 안전 관리",
+    "✅ 실시간 보안 모니터링",
+    "✅ 종합 감사 로깅",
+    "✅ 침입 탐지 시스템",
+)
+
+_OPERATION_TIPS = (
+    "정기적인 패스워드 및 API 키 로테이션",
+    "최소 권한 원칙 적용",
+    "모든 보안 이벤트 모니터링",
+    "정기적인 보안 감사 수행",
+    "침입 탐지 알림 즉시 대응",
+    "백업 데이터 암호화 보관",
+)
+
+def _print_section(title: str):
+    """구분선으로 감싼 섹션 제목 출력 (한 번의 write)"""
+    sys.stdout.write(f"\n{BAR}\n {title}\n{BAR}\n")
+
 def main():
     """메인 실행 함수"""
-    print("🛡️ Milvus 보안 및 인증 시스템")
-    print("=" * 80)
-    print(f"실행 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    run_at = datetime.now()
+    sys.stdout.write(
+        f"🛡️ Milvus 보안 및 인증 시스템\n{BAR}\n"
+        f"실행 시간: {run_at.isoformat(sep=' ', timespec='seconds')}\n"
+    )
     
-    manager = SecurityAuthManager()
+    manager = SecurityAuthManager(interactive=sys.stdout.isatty())
     
     try:
-        # 1. TLS 인증서 설정
-        print("\n" + "=" * 80)
-        print(" 🔐 TLS/SSL 인증서 설정")
-        print("=" * 80)
-        manager.create_tls_certificates()
-        
-        # 2. RBAC 설정
-        print("\n" + "=" * 80)
-        print(" 👥 RBAC 권한 관리")
-        print("=" * 80)
-        manager.create_rbac_configuration()
-        
-        # 3. 네트워크 보안
-        print("\n" + "=" * 80)
-        print(" 🌐 네트워크 보안 정책")
-        print("=" * 80)
-        manager.create_network_policies()
-        
-        # 4. 시크릿 관리
-        print("\n" + "=" * 80)
-        print(" 🔑 시크릿 관리 시스템")
-        print("=" * 80)
-        manager.create_secrets_management()
-        
-        # 5. 보안 모니터링
-        print("\n" + "=" * 80)
-        print(" 🔍 보안 모니터링")
-        print("=" * 80)
-        manager.create_security_monitoring()
+        # 1~5. 서로 독립적인 설정 파일 생성 단계는 병렬로 실행하고
+        # 진행 메시지는 단계 순서대로 출력
+        setup_steps = (
+            ("🔐 TLS/SSL 인증서 설정", manager.create_tls_certificates),
+            ("👥 RBAC 권한 관리", manager.create_rbac_configuration),
+            ("🌐 네트워크 보안 정책", manager.create_network_policies),
+            ("🔑 시크릿 관리 시스템", manager.create_secrets_management),
+            ("🔍 보안 모니터링", manager.create_security_monitoring),
+        )
+        with ThreadPoolExecutor(max_workers=len(setup_steps)) as executor:
+            futures = [executor.submit(manager.run_buffered, step) for _, step in setup_steps]
+            for (title, _), future in zip(setup_steps, futures):
+                _print_section(title)
+                sys.stdout.write(future.result())
         
         # 6. 보안 운영 시뮬레이션
-        print("\n" + "=" * 80)
-        print(" 🎮 보안 시스템 운영")
-        print("=" * 80)
+        _print_section("🎮 보안 시스템 운영")
         manager.simulate_security_operations()
         
         # 7. 보안 보고서 생성
-        print("\n" + "=" * 80)
-        print(" 📊 보안 상태 보고서")
-        print("=" * 80)
-        report = manager.generate_security_report()
+        _print_section("📊 보안 상태 보고서")
+        report = manager.generate_security_report(run_at)
         
         # 8. 요약
-        print("\n" + "=" * 80)
-        print(" 🛡️ 보안 설정 완료")
-        print("=" * 80)
-        
-        print("✅ 생성된 보안 리소스:")
-        security_resources = [
-            "security-configs/generate-certs.sh",
-            "security-configs/openssl.conf",
-            "security-configs/rbac/service-account.yaml",
-            "security-configs/rbac/cluster-role.yaml",
-            "security-configs/rbac/developer-role.yaml",
-            "security-configs/network-policies/default-deny-all.yaml",
-            "security-configs/network-policies/milvus-allow-traffic.yaml",
-            "security-configs/secrets/milvus-tls-secret.yaml",
-            "security-configs/secrets/milvus-db-credentials.yaml",
-            "security-configs/vault-config.yaml",
-            "security-configs/falco-rules.yaml",
-            "security-configs/security-monitoring.yaml",
-            "security-configs/user-permissions.json"
-        ]
+        _print_section("🛡️ 보안 설정 완료")
         
-        for resource in security_resources:
-            print(f"  📄 {resource}")
-        
-        print("\n🔒 보안 기능 요약:")
-        security_features = [
-            "✅ TLS/SSL 암호화 통신",
-            "✅ RBAC 역할 기반 접근 제어",
-            "✅ API 키 인증 시스템",
-            "✅ 네트워크 정책 기반 격리",
-            "✅ 시크릿 안전 관리",
-            "✅ 실시간 보안 모니터링",
-            "✅ 종합 감사 로깅",
-            "✅ 침입 탐지 시스템"
-        ]
+        sys.stdout.write("✅ 생성된 보안 리소스:\n")
+        sys.stdout.writelines(f"  📄 {resource}\n" for resource in _SECURITY_RESOURCES)
         
-        for feature in security_features:
-            print(f"  {feature}")
-        
-        print("\n💡 보안 운영 가이드:")
-        operation_tips = [
-            "정기적인 패스워드 및 API 키 로테이션",
-            "최소 권한 원칙 적용",
-            "모든 보안 이벤트 모니터링",
-            "정기적인 보안 감사 수행",
-            "침입 탐지 알림 즉시 대응",
-            "백업 데이터 암호화 보관"
-        ]
+        sys.stdout.write("\n🔒 보안 기능 요약:\n")
+        sys.stdout.writelines(f"  {feature}\n" for feature in _SECURITY_FEATURES)
         
-        for tip in operation_tips:
-            print(f"  • {tip}")
+        sys.stdout.write("\n💡 보안 운영 가이드:\n")
+        sys.stdout.writelines(f"  • {tip}\n" for tip in _OPERATION_TIPS)
             
     except Exception as e:
         print(f"❌ 오류 발생: {e}")
         import traceback
         traceback.print_exc()
     
-    print("\n🎉 보안 및 인증 실습 완료!")
-    print("\n💡 학습 포인트:")
-    print("  • 엔터프라이즈급 보안 아키텍처")
-    print("  • RBAC 기반 접근 제어")
-    print("  • TLS/SSL 암호화 구현")
-    print("  • 네트워크 보안 정책")
-    print("  • 실시간 보안 모니터링")
-    
-    print("\n🚀 다음 단계:")
-    print("  python step05_production/06_production_monitoring.py")
+    sys.stdout.write(
+        "\n🎉 보안 및 인증 실습 완료!\n"
+        "\n💡 학습 포인트:\n"
+        "  • 엔터프라이즈급 보안 아키텍처\n"
+        "  • RBAC 기반 접근 제어\n"
+        "  • TLS/SSL 암호화 구현\n"
+        "  • 네트워크 보안 정책\n"
+        "  • 실시간 보안 모니터링\n"
+        "\n🚀 다음 단계:\n"
+        "  python step05_production/06_production_monitoring.py\n"
+    )
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
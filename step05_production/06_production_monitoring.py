@@ -12,19 +12,645 @@ import os
 import sys
 import time
 import json
-import yaml
-import random
 import threading
+import operator
+import re
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from types import MappingProxyType
+from typing import Callable, Dict, List, Any, Mapping, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
-import statistics
+import numpy as np
 
 # 공통 모듈 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
+# 수집 메트릭 (링 버퍼의 행 순서)
+METRIC_NAMES = (
+    'response_time_ms',
+    'requests_per_second',
+    'error_rate',
+    'memory_usage_gb',
+    'cpu_usage_percent',
+    'availability'
+)
+METRIC_INDEX = {name: i for i, name in enumerate(METRIC_NAMES)}
+METRIC_SAMPLE_MINUTES = 5  # 샘플 간격 (분)
+METRICS_CAPACITY = 7 * 24 * 60 // METRIC_SAMPLE_MINUTES  # 메트릭별 보관 샘플 수 (7일치)
+
+# SLA metric_name 별 평가 방법: (metrics_data 키, 집계 함수, 목표값 속성, 비교 연산, 집계값으로 판정 여부)
+# 집계값으로 판정하지 않는 SLA 는 샘플 준수율 >= target_percentage 로 판정한다.
+_SLA_EVALUATORS = {
+    'response_time_ms': ('response_time_ms', lambda data: np.percentile(data, 95), 'threshold', operator.le, True),
+    'error_rate': ('error_rate', np.mean, 'threshold', operator.le, False),
+    'requests_per_second': ('requests_per_second', np.mean, 'threshold', operator.ge, False),
+    'up': ('availability', lambda data: np.mean(data) * 100, 'target_percentage', operator.ge, False)  # 백분율
+}
+
+# SLA comparison 별 샘플 단위 비교 (벡터화된 NumPy ufunc)
+_SAMPLE_COMPARATORS = {
+    'less_than': np.less,
+    'greater_than': np.greater,
+    'equal': np.equal
+}
+
+# SLA 별 상태 출력 템플릿 (check_sla_compliance 에서 format 을 미리 바인딩해 사용)
+_SLA_STATUS_TEMPLATE = (
+    "  {name}: {status}\n"
+    "    현재값: {value:.2f}\n"
+    "    목표값: {target}\n"
+    "    SLA: {sla_percentage}% (샘플 준수율: {compliance:.2f}%)"
+)
+
+# 시뮬레이션 모델 (availability 를 제외한 METRIC_NAMES 앞 5개 행)
+# 값 = 기본값 * (1 + (트래픽 배수 - 1) * 민감도) + N(0, 노이즈 표준편차), 하한으로 절단
+_METRIC_BASE = np.array([80, 1500, 0.002, 8.5, 45], dtype=np.float64)
+_TRAFFIC_SENSITIVITY = np.array([0.3, 1.0, 0.5, 0.2, 1.0], dtype=np.float64)
+_NOISE_STD = np.array([15, 200, 0.001, 0.5, 10], dtype=np.float64)
+_METRIC_FLOOR = np.array([20, 100, 0, 4, 10], dtype=np.float64)
+
+# 24시간 데이터 시뮬레이션 (5분 간격)과 시점별 트래픽 배수 범위 [low, low + span)
+SIMULATION_TIME_POINTS = 24 * 12  # 288 data points
+_BUSINESS_HOURS = np.isin((np.arange(SIMULATION_TIME_POINTS) * 5) // 60, range(9, 19))  # 업무 시간(9-18시)
+_TRAFFIC_LOW = np.where(_BUSINESS_HOURS, 1.3, 0.6)   # 1.5 + U(-0.2, 0.3) / 0.7 + U(-0.1, 0.2)
+_TRAFFIC_SPAN = np.where(_BUSINESS_HOURS, 0.5, 0.3)
+
+# Prometheus 설정 템플릿 (클러스터/리전/네임스페이스/수집 주기만 치환, YAML 직렬화 불필요)
+# 수집 주기는 global 한 곳에서만 지정하고 모든 job 이 상속한다.
+# 알림 규칙의 rate()/avg_over_time() 구간은 수집 주기의 4배 이상이어야 한다 (_scrape_interval_from_env 에서 검증).
+_PROMETHEUS_TEMPLATE = '''alerting:
+  alertmanagers:
+  - static_configs:
+    - targets:
+      - alertmanager:9093
+global:
+  evaluation_interval: 15s
+  external_labels:
+    cluster: {cluster}
+    region: {region}
+  scrape_interval: {scrape_interval}s
+rule_files:
+- alerts/*.yml
+scrape_configs:
+- job_name: milvus-production
+  metrics_path: /metrics
+  scrape_timeout: {scrape_timeout}s
+  static_configs:
+  - targets:
+    - milvus:9091
+- job_name: milvus-etcd
+  metrics_path: /metrics
+  static_configs:
+  - targets:
+    - etcd:2379
+- job_name: milvus-minio
+  metrics_path: /minio/v2/metrics/cluster
+  static_configs:
+  - targets:
+    - minio:9000
+- job_name: kubernetes-nodes
+  kubernetes_sd_configs:
+  - role: node
+  relabel_configs:
+  - regex: (.*):10250
+    replacement: ${{1}}:9100
+    source_labels:
+    - __address__
+    target_label: __address__
+- job_name: kubernetes-pods
+  kubernetes_sd_configs:
+  - namespaces:
+      names:
+      - {namespace}
+    role: pod
+  relabel_configs:
+  - action: keep
+    regex: true
+    source_labels:
+    - __meta_kubernetes_pod_annotation_prometheus_io_scrape
+'''
+
+# Milvus 서비스 알림
+_MILVUS_ALERTS = {
+    'groups': [
+        {
+            'name': 'milvus.rules',
+            'rules': [
+                {
+                    'alert': 'MilvusDown',
+                    'expr': 'up{job="milvus-production"} == 0',
+                    'for': '1m',
+                    'labels': {
+                        'severity': 'critical',
+                        'service': 'milvus'
+                    },
+                    'annotations': {
+                        'summary': 'Milvus instance is down',
+                        'description': 'Milvus instance {{ $labels.instance }} has been down for more than 1 minute.'
+                    }
+                },
+                {
+                    'alert': 'MilvusHighResponseTime',
+                    'expr': 'histogram_quantile(0.95, milvus_request_duration_seconds_bucket) > 0.2',
+                    'for': '5m',
+                    'labels': {
+                        'severity': 'warning',
+                        'service': 'milvus'
+                    },
+                    'annotations': {
+                        'summary': 'Milvus high response time',
+                        'description': '95th percentile response time is {{ $value }}s for the last 5 minutes.'
+                    }
+                },
+                {
+                    'alert': 'MilvusHighErrorRate',
+                    'expr': 'rate(milvus_errors_total[5m]) / rate(milvus_requests_total[5m]) > 0.01',
+                    'for': '3m',
+                    'labels': {
+                        'severity': 'critical',
+                        'service': 'milvus'
+                    },
+                    'annotations': {
+                        'summary': 'Milvus high error rate',
+                        'description': 'Error rate is {{ $value | humanizePercentage }} for the last 5 minutes.'
+                    }
+                },
+                {
+                    'alert': 'MilvusHighMemoryUsage',
+                    'expr': 'milvus_memory_usage_bytes / milvus_memory_limit_bytes > 0.85',
+                    'for': '10m',
+                    'labels': {
+                        'severity': 'warning',
+                        'service': 'milvus'
+                    },
+                    'annotations': {
+                        'summary': 'Milvus high memory usage',
+                        'description': 'Memory usage is {{ $value | humanizePercentage }} for instance {{ $labels.instance }}.'
+                    }
+                },
+                {
+                    'alert': 'MilvusLowThroughput',
+                    'expr': 'rate(milvus_requests_total[5m]) < 100',
+                    'for': '15m',
+                    'labels': {
+                        'severity': 'warning',
+                        'service': 'milvus'
+                    },
+                    'annotations': {
+                        'summary': 'Milvus low throughput',
+                        'description': 'Request rate is {{ $value }} requests/second, which is below expected threshold.'
+                    }
+                }
+            ]
+        },
+        {
+            'name': 'infrastructure.rules',
+            'rules': [
+                {
+                    'alert': 'HighCPUUsage',
+                    'expr': '100 - (avg by(instance) (rate(node_cpu_seconds_total{mode="idle"}[2m])) * 100) > 80',
+                    'for': '5m',
+                    'labels': {
+                        'severity': 'warning'
+                    },
+                    'annotations': {
+                        'summary': 'High CPU usage detected',
+                        'description': 'CPU usage is {{ $value }}% on {{ $labels.instance }}.'
+                    }
+                },
+                {
+                    'alert': 'HighMemoryUsage',
+                    'expr': '(1 - (node_memory_MemAvailable_bytes / node_memory_MemTotal_bytes)) * 100 > 85',
+                    'for': '5m',
+                    'labels': {
+                        'severity': 'warning'
+                    },
+                    'annotations': {
+                        'summary': 'High memory usage detected',
+                        'description': 'Memory usage is {{ $value }}% on {{ $labels.instance }}.'
+                    }
+                },
+                {
+                    'alert': 'DiskSpaceLow',
+                    'expr': '(1 - (node_filesystem_avail_bytes / node_filesystem_size_bytes)) * 100 > 85',
+                    'for': '5m',
+                    'labels': {
+                        'severity': 'critical'
+                    },
+                    'annotations': {
+                        'summary': 'Disk space running low',
+                        'description': 'Disk usage is {{ $value }}% on {{ $labels.instance }}:{{ $labels.mountpoint }}.'
+                    }
+                }
+            ]
+        }
+    ]
+}
+
+# SLA 기반 알림
+_SLA_ALERTS = {
+    'groups': [
+        {
+            'name': 'sla.rules',
+            'rules': [
+                {
+                    'alert': 'SLAAvailabilityBreach',
+                    'expr': 'avg_over_time(up{job="milvus-production"}[1h]) < 0.999',
+                    'for': '0m',
+                    'labels': {
+                        'severity': 'critical',
+                        'sla': 'availability'
+                    },
+                    'annotations': {
+                        'summary': 'SLA availability breach detected',
+                        'description': 'Availability SLA (99.9%) has been breached. Current: {{ $value | humanizePercentage }}'
+                    }
+                },
+                {
+                    'alert': 'SLAResponseTimeBreach',
+                    'expr': 'histogram_quantile(0.95, avg_over_time(milvus_request_duration_seconds_bucket[1h])) > 0.2',
+                    'for': '0m',
+                    'labels': {
+                        'severity': 'critical',
+                        'sla': 'response_time'
+                    },
+                    'annotations': {
+                        'summary': 'SLA response time breach detected',
+                        'description': '95th percentile response time SLA (200ms) has been breached. Current: {{ $value }}s'
+                    }
+                }
+            ]
+        }
+    ]
+}
+
+# Prometheus 수집 주기 설정 (환경변수, 초)
+SCRAPE_INTERVAL_ENV = "PROM_SCRAPE_INTERVAL"
+DEFAULT_SCRAPE_INTERVAL_S = 30
+_RANGE_WINDOW = re.compile(r'\[(\d+)([smhd])\]')
+_UNIT_SECONDS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+def _min_rule_window_s(*rule_files: Dict) -> int:
+    """알림 규칙 expr 의 rate()/avg_over_time() 구간 중 가장 짧은 값(초)"""
+    return min(
+        int(amount) * _UNIT_SECONDS[unit]
+        for rule_file in rule_files
+        for group in rule_file['groups']
+        for rule in group['rules']
+        for amount, unit in _RANGE_WINDOW.findall(rule['expr'])
+    )
+
+_MIN_RULE_WINDOW_S = _min_rule_window_s(_MILVUS_ALERTS, _SLA_ALERTS)
+
+def _scrape_interval_from_env() -> int:
+    """PROM_SCRAPE_INTERVAL 검증 (양의 정수, 가장 짧은 규칙 구간이 수집 주기의 4배 이상)"""
+    raw = os.getenv(SCRAPE_INTERVAL_ENV) or str(DEFAULT_SCRAPE_INTERVAL_S)  # 비어 있으면 기본값
+    try:
+        interval = int(raw)
+    except ValueError:
+        interval = 0
+    if interval <= 0:
+        raise ValueError(f"{SCRAPE_INTERVAL_ENV} 는 양의 정수(초)여야 합니다: {raw!r}")
+    if interval * 4 > _MIN_RULE_WINDOW_S:
+        raise ValueError(
+            f"{SCRAPE_INTERVAL_ENV}={interval}s 가 너무 깁니다: 알림 규칙의 최소 구간 "
+            f"{_MIN_RULE_WINDOW_S}s 는 수집 주기의 4배 이상이어야 합니다 (최대 {_MIN_RULE_WINDOW_S // 4}s)")
+    return interval
+
+# 메인 운영 대시보드
+_MAIN_DASHBOARD = {
+    'dashboard': {
+        'title': 'Milvus Production Overview',
+        'tags': ['milvus', 'production'],
+        'timezone': 'browser',
+        'refresh': '30s',
+        'time': {
+            'from': 'now-1h',
+            'to': 'now'
+        },
+        'panels': [
+            {
+                'id': 1,
+                'title': 'Service Status',
+                'type': 'stat',
+                'targets': [
+                    {
+                        'expr': 'up{job="milvus-production"}',
+                        'legendFormat': 'Milvus Status'
+                    }
+                ],
+                'fieldConfig': {
+                    'defaults': {
+                        'color': {
+                            'mode': 'thresholds'
+                        },
+                        'thresholds': {
+                            'steps': [
+                                {'color': 'red', 'value': 0},
+                                {'color': 'green', 'value': 1}
+                            ]
+                        }
+                    }
+                },
+                'gridPos': {'h': 4, 'w': 6, 'x': 0, 'y': 0}
+            },
+            {
+                'id': 2,
+                'title': 'Request Rate (QPS)',
+                'type': 'graph',
+                'targets': [
+                    {
+                        'expr': 'rate(milvus_requests_total[5m])',
+                        'legendFormat': 'Requests/sec'
+                    }
+                ],
+                'yAxes': [
+                    {'label': 'Requests/sec', 'min': 0}
+                ],
+                'gridPos': {'h': 8, 'w': 12, 'x': 6, 'y': 0}
+            },
+            {
+                'id': 3,
+                'title': 'Response Time (95th percentile)',
+                'type': 'graph',
+                'targets': [
+                    {
+                        'expr': 'histogram_quantile(0.95, milvus_request_duration_seconds_bucket)',
+                        'legendFormat': '95th percentile'
+                    },
+                    {
+                        'expr': 'histogram_quantile(0.50, milvus_request_duration_seconds_bucket)', 
+                        'legendFormat': '50th percentile'
+                    }
+                ],
+                'yAxes': [
+                    {'label': 'Seconds', 'min': 0}
+                ],
+                'gridPos': {'h': 8, 'w': 12, 'x': 0, 'y': 8}
+            },
+            {
+                'id': 4,
+                'title': 'Error Rate',
+                'type': 'graph',
+                'targets': [
+                    {
+                        'expr': 'rate(milvus_errors_total[5m]) / rate(milvus_requests_total[5m])',
+                        'legendFormat': 'Error Rate'
+                    }
+                ],
+                'yAxes': [
+                    {'label': 'Percentage', 'min': 0, 'max': 1}
+                ],
+                'gridPos': {'h': 8, 'w': 12, 'x': 12, 'y': 8}
+            },
+            {
+                'id': 5,
+                'title': 'Memory Usage',
+                'type': 'graph',
+                'targets': [
+                    {
+                        'expr': 'milvus_memory_usage_bytes / 1024 / 1024 / 1024',
+                        'legendFormat': 'Memory Usage (GB)'
+                    }
+                ],
+                'gridPos': {'h': 8, 'w': 12, 'x': 0, 'y': 16}
+            },
+            {
+                'id': 6,
+                'title': 'Active Collections',
+                'type': 'stat',
+                'targets': [
+                    {
+                        'expr': 'milvus_collections_total',
+                        'legendFormat': 'Collections'
+                    }
+                ],
+                'gridPos': {'h': 8, 'w': 12, 'x': 12, 'y': 16}
+            }
+        ]
+    }
+}
+
+# SLA 대시보드
+_SLA_DASHBOARD = {
+    'dashboard': {
+        'title': 'Milvus SLA Monitoring',
+        'tags': ['milvus', 'sla'],
+        'panels': [
+            {
+                'id': 1,
+                'title': 'Availability SLA (99.9%)',
+                'type': 'stat',
+                'targets': [
+                    {
+                        'expr': 'avg_over_time(up{job="milvus-production"}[24h]) * 100',
+                        'legendFormat': 'Availability %'
+                    }
+                ],
+                'thresholds': [
+                    {'color': 'red', 'value': 0},
+                    {'color': 'yellow', 'value': 99.0},
+                    {'color': 'green', 'value': 99.9}
+                ]
+            },
+            {
+                'id': 2,
+                'title': 'Response Time SLA (95% < 200ms)',
+                'type': 'stat',
+                'targets': [
+                    {
+                        'expr': 'histogram_quantile(0.95, avg_over_time(milvus_request_duration_seconds_bucket[24h])) * 1000',
+                        'legendFormat': '95th percentile (ms)'
+                    }
+                ],
+                'thresholds': [
+                    {'color': 'green', 'value': 0},
+                    {'color': 'yellow', 'value': 200},
+                    {'color': 'red', 'value': 500}
+                ]
+            }
+        ]
+    }
+}
+
+# 인프라 대시보드
+_INFRA_DASHBOARD = {
+    'dashboard': {
+        'title': 'Milvus Infrastructure Monitoring',
+        'tags': ['milvus', 'infrastructure'],
+        'panels': [
+            {
+                'id': 1,
+                'title': 'CPU Usage',
+                'type': 'graph',
+                'targets': [
+                    {
+                        'expr': '100 - (avg by(instance) (rate(node_cpu_seconds_total{mode="idle"}[2m])) * 100)',
+                        'legendFormat': 'CPU Usage %'
+                    }
+                ]
+            },
+            {
+                'id': 2,
+                'title': 'Memory Usage',
+                'type': 'graph',
+                'targets': [
+                    {
+                        'expr': '(1 - (node_memory_MemAvailable_bytes / node_memory_MemTotal_bytes)) * 100',
+                        'legendFormat': 'Memory Usage %'
+                    }
+                ]
+            },
+            {
+                'id': 3,
+                'title': 'Network I/O',
+                'type': 'graph',
+                'targets': [
+                    {
+                        'expr': 'rate(node_network_receive_bytes_total[5m])',
+                        'legendFormat': 'Receive'
+                    },
+                    {
+                        'expr': 'rate(node_network_transmit_bytes_total[5m])',
+                        'legendFormat': 'Transmit'
+                    }
+                ]
+            }
+        ]
+    }
+}
+
+# Alertmanager 설정
+_ALERTMANAGER_CONFIG = {
+    'global': {
+        'smtp_smarthost': 'smtp.example.com:587',
+        'smtp_from': 'alerts@example.com'
+    },
+    'route': {
+        'group_by': ['alertname'],
+        'group_wait': '10s',
+        'group_interval': '10s',
+        'repeat_interval': '1h',
+        'receiver': 'web.hook',
+        'routes': [
+            {
+                'match': {
+                    'severity': 'critical'
+                },
+                'receiver': 'critical-alerts',
+                'repeat_interval': '5m'
+            },
+            {
+                'match': {
+                    'severity': 'warning'
+                },
+                'receiver': 'warning-alerts',
+                'repeat_interval': '30m'
+            }
+        ]
+    },
+    'receivers': [
+        {
+            'name': 'web.hook',
+            'webhook_configs': [
+                {
+                    'url': 'http://webhook.example.com/alerts',
+                    'send_resolved': True
+                }
+            ]
+        },
+        {
+            'name': 'critical-alerts',
+            'email_configs': [
+                {
+                    'to': 'oncall@example.com',
+                    'subject': '[CRITICAL] Milvus Alert: {{ .GroupLabels.alertname }}',
+                    'body': '''
+Alert: {{ .GroupLabels.alertname }}
+Severity: {{ .CommonLabels.severity }}
+Description: {{ range .Alerts }}{{ .Annotations.description }}{{ end }}
+Instance: {{ .CommonLabels.instance }}
+Time: {{ .CommonAnnotations.timestamp }}
+'''
+                }
+            ],
+            'slack_configs': [
+                {
+                    'api_url': 'https://hooks.slack.com/services/YOUR/SLACK/WEBHOOK',
+                    'channel': '#alerts-critical',
+                    'title': 'Critical Alert: {{ .GroupLabels.alertname }}',
+                    'text': '{{ range .Alerts }}{{ .Annotations.description }}{{ end }}'
+                }
+            ],
+            'pagerduty_configs': [
+                {
+                    'service_key': 'YOUR_PAGERDUTY_KEY',
+                    'description': '{{ .GroupLabels.alertname }}: {{ range .Alerts }}{{ .Annotations.description }}{{ end }}'
+                }
+            ]
+        },
+        {
+            'name': 'warning-alerts',
+            'email_configs': [
+                {
+                    'to': 'team@example.com',
+                    'subject': '[WARNING] Milvus Alert: {{ .GroupLabels.alertname }}',
+                    'body': '''
+Alert: {{ .GroupLabels.alertname }}
+Severity: {{ .CommonLabels.severity }}
+Description: {{ range .Alerts }}{{ .Annotations.description }}{{ end }}
+'''
+                }
+            ]
+        }
+    ]
+}
+
+# 파일명 -> 정적 설정 상수
+_STATIC_CONFIGS = {
+    'milvus-alerts.yml': _MILVUS_ALERTS,
+    'sla-alerts.yml': _SLA_ALERTS,
+    'main-dashboard.json': _MAIN_DASHBOARD,
+    'sla-dashboard.json': _SLA_DASHBOARD,
+    'infrastructure-dashboard.json': _INFRA_DASHBOARD,
+    'alertmanager.yml': _ALERTMANAGER_CONFIG
+}
+
+@functools.lru_cache(maxsize=None)
+def _static_config_bytes(filename: str) -> bytes:
+    """정적 설정 파일 내용 (프로세스당 한 번만 직렬화)"""
+    config = _STATIC_CONFIGS[filename]
+    if filename.endswith('.json'):
+        return json.dumps(config, indent=2).encode('utf-8')
+    
+    # PyYAML 은 YAML 설정을 직렬화할 때만 로드 (모듈 import 시간 단축)
+    import yaml
+    try:
+        from yaml import CSafeDumper as YamlDumper  # libyaml C 바인딩
+    except ImportError:
+        from yaml import SafeDumper as YamlDumper
+    return yaml.dump(config, Dumper=YamlDumper, default_flow_style=False, encoding='utf-8')
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    """내용이 달라졌을 때만 파일 쓰기 (같은 설정을 다시 생성하면 쓰기 생략), 기록 여부 반환"""
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
+def _write_script(path: Path, content: str) -> bool:
+    """운영 스크립트 기록 후 실행 권한(0o755) 부여, 기록 여부 반환"""
+    written = _write_if_changed(path, content.encode('utf-8'))
+    if path.stat().st_mode & 0o777 != 0o755:
+        path.chmod(0o755)
+    return written
+
 class AlertSeverity(Enum):
     """알림 심각도"""
     CRITICAL = "critical"
@@ -55,14 +681,67 @@ class Alert:
     severity: AlertSeverity
     message: str
     timestamp: datetime
-    labels: Dict[str, str]
+    labels: Mapping[str, str]
     resolved: bool = False
 
+# 심각도별 출력 이모지
+_SEVERITY_EMOJI = {
+    AlertSeverity.CRITICAL: "🔴",
+    AlertSeverity.WARNING: "🟡",
+    AlertSeverity.INFO: "🔵"
+}
+
+# 알림별 공통 라벨 (읽기 전용, 같은 종류의 알림이 하나의 객체를 공유)
+_LBL_RESPONSE_TIME = MappingProxyType({'service': 'milvus', 'metric': 'response_time'})
+_LBL_ERROR_RATE = MappingProxyType({'service': 'milvus', 'metric': 'error_rate'})
+_LBL_MEMORY = MappingProxyType({'service': 'milvus', 'metric': 'memory'})
+_LBL_CPU = MappingProxyType({'service': 'milvus', 'metric': 'cpu'})
+_LBL_AVAILABILITY = MappingProxyType({'service': 'milvus', 'metric': 'availability'})
+
+# 알림 규칙: (이름, 메트릭, 임계값, 임계값 이하일 때 발생 여부, 기본 심각도, CRITICAL 승격 임계값, 메시지, 라벨)
+_ALERT_RULES = (
+    ("HighResponseTime", 'response_time_ms', 200, False, AlertSeverity.WARNING, 500,
+     "Response time is {value:.1f}ms", _LBL_RESPONSE_TIME),
+    ("HighErrorRate", 'error_rate', 0.01, False, AlertSeverity.CRITICAL, np.inf,
+     "Error rate is {value:.3f}%", _LBL_ERROR_RATE),
+    ("HighMemoryUsage", 'memory_usage_gb', 12, False, AlertSeverity.WARNING, np.inf,
+     "Memory usage is {value:.1f}GB", _LBL_MEMORY),
+    ("HighCPUUsage", 'cpu_usage_percent', 80, False, AlertSeverity.WARNING, np.inf,
+     "CPU usage is {value:.1f}%", _LBL_CPU),
+    ("ServiceDown", 'availability', 0, True, AlertSeverity.CRITICAL, np.inf,
+     "Milvus service is not responding", _LBL_AVAILABILITY),
+)
+_ALERT_METRICS = tuple(rule[1] for rule in _ALERT_RULES)
+_ALERT_THRESHOLDS = np.array([rule[2] for rule in _ALERT_RULES], dtype=np.float64)
+_ALERT_BELOW = np.array([rule[3] for rule in _ALERT_RULES])
+_ALERT_CRITICAL_ABOVE = np.array([rule[5] for rule in _ALERT_RULES], dtype=np.float64)
+
+class _CompiledSLA(NamedTuple):
+    """평가 방법을 미리 결정해 둔 SLA (check_sla_compliance 에서 문자열 분기 없이 사용)"""
+    sla: SLA
+    data_key: str
+    reducer: Callable[[np.ndarray], Any]
+    target: float
+    compare: Callable[[float, float], bool]
+    sample_compare: np.ufunc
+    judge_by_value: bool  # False 면 샘플 준수율로 판정
+
+def _compile_sla(sla: SLA) -> _CompiledSLA:
+    """SLA 정의로부터 집계 함수/목표값/비교 연산을 한 번만 결정"""
+    data_key, reducer, target_attr, compare, judge_by_value = _SLA_EVALUATORS[sla.metric_name]
+    return _CompiledSLA(sla, data_key, reducer, getattr(sla, target_attr), compare,
+                        _SAMPLE_COMPARATORS[sla.comparison], judge_by_value)
+
 class ProductionMonitoringManager:
     """프로덕션 모니터링 관리자"""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.namespace = "milvus-production"
+        self.cluster = "milvus-production"
+        self.region = "us-west-2"
+        # Prometheus 수집 주기(초): 샘플 수집량과 룰 평가 부하를 줄이기 위해 기본 30초
+        self.scrape_interval_s = _scrape_interval_from_env()
+        self._rng = np.random.default_rng(seed)  # 메트릭 시뮬레이션용 난수 생성기
         self.monitoring_dir = Path("monitoring-configs")
         self.dashboards_dir = self.monitoring_dir / "dashboards"
         self.alerts_dir = self.monitoring_dir / "alerts"
@@ -79,654 +758,185 @@ class ProductionMonitoringManager:
             SLA("throughput", 90.0, 60, "requests_per_second", 1000, "greater_than")
         ]
         
-        # 모니터링 데이터
-        self.metrics_data: Dict[str, List] = {}
-        self.active_alerts: List[Alert] = []
+        # SLA 평가 계획 (metric_name 분기는 생성 시점에 한 번만 해석)
+        self._compiled_slas = [
+            _compile_sla(sla) for sla in self.slas if sla.metric_name in _SLA_EVALUATORS
+        ]
+        
+        # 모니터링 데이터: 메트릭별 float32 링 버퍼 (Struct-of-Arrays, 메트릭당 한 행)
+        self._metric_buffer = np.empty((len(METRIC_NAMES), METRICS_CAPACITY), dtype=np.float32)
+        self._write_idx = 0
+        self._filled = 0
+        # 메트릭별 누적 합계/최댓값 (샘플 추가 시 갱신, 집계 시 버퍼 재스캔 불필요)
+        self._metric_sum = np.zeros(len(METRIC_NAMES), dtype=np.float64)
+        self._metric_max = np.full(len(METRIC_NAMES), -np.inf)
+        # 활성 알림: 이름 -> 알림, 심각도별 인덱스 (추가/해제 O(1))
+        self.active_alerts: Dict[str, Alert] = {}
+        self._alerts_by_severity: Dict[AlertSeverity, Dict[str, Alert]] = {
+            severity: {} for severity in AlertSeverity
+        }
         self.sla_history: Dict[str, List] = {}
         
         # 모니터링 상태
         self.monitoring_active = False
+        
+        # 병렬 설정 단계의 진행 메시지 버퍼 (스레드별)
+        self._log_local = threading.local()
+    
+    @property
+    def metrics_data(self) -> Dict[str, np.ndarray]:
+        """메트릭별 보관 샘플 뷰 (집계용, 버퍼가 한 바퀴 돈 뒤에는 시간순이 아님)"""
+        return {name: self._metric_buffer[i, :self._filled] for i, name in enumerate(METRIC_NAMES)}
+    
+    def _append_metrics(self, samples: np.ndarray):
+        """(메트릭 수, n) 샘플을 링 버퍼에 기록 (용량을 넘으면 가장 오래된 샘플부터 덮어씀)"""
+        samples = samples[:, -METRICS_CAPACITY:]
+        n = samples.shape[1]
+        positions = (self._write_idx + np.arange(n)) % METRICS_CAPACITY
+        
+        # 덮어쓸 샘플은 누적 합계에서 빼고, 현재 최댓값이 밀려나는 메트릭은 다시 계산
+        evicted = self._metric_buffer[:, positions[positions < self._filled]]
+        stale_max = np.zeros(len(METRIC_NAMES), dtype=bool)
+        if evicted.size:
+            self._metric_sum -= evicted.sum(axis=1, dtype=np.float64)
+            stale_max = evicted.max(axis=1) >= self._metric_max
+        
+        self._metric_buffer[:, positions] = samples
+        self._write_idx = (self._write_idx + n) % METRICS_CAPACITY
+        self._filled = min(self._filled + n, METRICS_CAPACITY)
+        
+        written = self._metric_buffer[:, positions]
+        self._metric_sum += written.sum(axis=1, dtype=np.float64)
+        np.maximum(self._metric_max, written.max(axis=1), out=self._metric_max)
+        for i in np.flatnonzero(stale_max).tolist():
+            self._metric_max[i] = self._metric_buffer[i, :self._filled].max()
+    
+    def running_mean(self, name: str) -> float:
+        """보관 중인 샘플의 평균 (누적 합계 기반, O(1))"""
+        return float(self._metric_sum[METRIC_INDEX[name]] / max(self._filled, 1))
+    
+    def running_max(self, name: str) -> float:
+        """보관 중인 샘플의 최댓값 (O(1))"""
+        return float(self._metric_max[METRIC_INDEX[name]])
+    
+    def add_alert(self, alert: Alert):
+        """활성 알림 등록 (같은 이름의 기존 알림은 교체)"""
+        previous = self.active_alerts.pop(alert.name, None)
+        if previous is not None:
+            del self._alerts_by_severity[previous.severity][previous.name]
+        self.active_alerts[alert.name] = alert
+        self._alerts_by_severity[alert.severity][alert.name] = alert
+    
+    def resolve_alert(self, name: str) -> Optional[Alert]:
+        """활성 알림 해제, 해제된 알림 반환 (없으면 None)"""
+        alert = self.active_alerts.pop(name, None)
+        if alert is not None:
+            del self._alerts_by_severity[alert.severity][name]
+            alert.resolved = True
+        return alert
+    
+    def _log(self, message: str):
+        """진행 메시지 출력 (_run_buffered 안에서는 스레드별 버퍼에 모음)"""
+        lines = getattr(self._log_local, 'lines', None)
+        if lines is None:
+            print(message)
+        else:
+            lines.append(message)
+    
+    def _run_buffered(self, step: Callable[[], Any]) -> str:
+        """설정 단계를 실행하고 그동안의 진행 메시지를 한 덩어리로 반환"""
+        self._log_local.lines = lines = []
+        try:
+            step()
+        finally:
+            self._log_local.lines = None
+        return "".join(f"{line}\n" for line in lines)
+    
+    def generate_all_configs(self):
+        """서로 독립적인 설정 파일 생성 단계를 병렬 실행 (진행 메시지는 단계 순서대로 출력)"""
+        steps = (
+            self.create_prometheus_config,
+            self.create_alert_rules,
+            self.create_grafana_dashboards,
+            self.create_alertmanager_config
+        )
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            futures = [executor.submit(self._run_buffered, step) for step in steps]
+            for future in futures:
+                sys.stdout.write(future.result())
     
     def create_prometheus_config(self):
         """Prometheus 설정 생성"""
-        print("📊 Prometheus 모니터링 설정 중...")
-        
-        prometheus_config = {
-            'global': {
-                'scrape_interval': '15s',
-                'evaluation_interval': '15s',
-                'external_labels': {
-                    'cluster': 'milvus-production',
-                    'region': 'us-west-2'
-                }
-            },
-            'rule_files': [
-                'alerts/*.yml'
-            ],
-            'alerting': {
-                'alertmanagers': [
-                    {
-                        'static_configs': [
-                            {
-                                'targets': ['alertmanager:9093']
-                            }
-                        ]
-                    }
-                ]
-            },
-            'scrape_configs': [
-                {
-                    'job_name': 'milvus-production',
-                    'static_configs': [
-                        {
-                            'targets': ['milvus:9091']
-                        }
-                    ],
-                    'metrics_path': '/metrics',
-                    'scrape_interval': '30s',
-                    'scrape_timeout': '10s'
-                },
-                {
-                    'job_name': 'milvus-etcd',
-                    'static_configs': [
-                        {
-                            'targets': ['etcd:2379']
-                        }
-                    ],
-                    'metrics_path': '/metrics'
-                },
-                {
-                    'job_name': 'milvus-minio',
-                    'static_configs': [
-                        {
-                            'targets': ['minio:9000']
-                        }
-                    ],
-                    'metrics_path': '/minio/v2/metrics/cluster'
-                },
-                {
-                    'job_name': 'kubernetes-nodes',
-                    'kubernetes_sd_configs': [
-                        {
-                            'role': 'node'
-                        }
-                    ],
-                    'relabel_configs': [
-                        {
-                            'source_labels': ['__address__'],
-                            'regex': '(.*):10250',
-                            'target_label': '__address__',
-                            'replacement': '${1}:9100'
-                        }
-                    ]
-                },
-                {
-                    'job_name': 'kubernetes-pods',
-                    'kubernetes_sd_configs': [
-                        {
-                            'role': 'pod',
-                            'namespaces': {
-                                'names': ['milvus-production']
-                            }
-                        }
-                    ],
-                    'relabel_configs': [
-                        {
-                            'source_labels': ['__meta_kubernetes_pod_annotation_prometheus_io_scrape'],
-                            'action': 'keep',
-                            'regex': True
-                        }
-                    ]
-                }
-            ]
-        }
+        self._log("📊 Prometheus 모니터링 설정 중...")
         
-        with open(self.monitoring_dir / 'prometheus.yml', 'w') as f:
-            yaml.dump(prometheus_config, f, default_flow_style=False)
+        prometheus_config = _PROMETHEUS_TEMPLATE.format(
+            cluster=self.cluster, region=self.region, namespace=self.namespace,
+            scrape_interval=self.scrape_interval_s,
+            scrape_timeout=min(10, self.scrape_interval_s))
+        _write_if_changed(self.monitoring_dir / 'prometheus.yml', prometheus_config.encode('utf-8'))
         
-        print("  ✅ Prometheus 설정 생성됨")
+        self._log("  ✅ Prometheus 설정 생성됨")
     
     def create_alert_rules(self):
         """알림 규칙 생성"""
-        print("🚨 알림 규칙 설정 중...")
+        self._log("🚨 알림 규칙 설정 중...")
         
-        # Milvus 서비스 알림
-        milvus_alerts = {
-            'groups': [
-                {
-                    'name': 'milvus.rules',
-                    'rules': [
-                        {
-                            'alert': 'MilvusDown',
-                            'expr': 'up{job="milvus-production"} == 0',
-                            'for': '1m',
-                            'labels': {
-                                'severity': 'critical',
-                                'service': 'milvus'
-                            },
-                            'annotations': {
-                                'summary': 'Milvus instance is down',
-                                'description': 'Milvus instance {{ $labels.instance }} has been down for more than 1 minute.'
-                            }
-                        },
-                        {
-                            'alert': 'MilvusHighResponseTime',
-                            'expr': 'histogram_quantile(0.95, milvus_request_duration_seconds_bucket) > 0.2',
-                            'for': '5m',
-                            'labels': {
-                                'severity': 'warning',
-                                'service': 'milvus'
-                            },
-                            'annotations': {
-                                'summary': 'Milvus high response time',
-                                'description': '95th percentile response time is {{ $value }}s for the last 5 minutes.'
-                            }
-                        },
-                        {
-                            'alert': 'MilvusHighErrorRate',
-                            'expr': 'rate(milvus_errors_total[5m]) / rate(milvus_requests_total[5m]) > 0.01',
-                            'for': '3m',
-                            'labels': {
-                                'severity': 'critical',
-                                'service': 'milvus'
-                            },
-                            'annotations': {
-                                'summary': 'Milvus high error rate',
-                                'description': 'Error rate is {{ $value | humanizePercentage }} for the last 5 minutes.'
-                            }
-                        },
-                        {
-                            'alert': 'MilvusHighMemoryUsage',
-                            'expr': 'milvus_memory_usage_bytes / milvus_memory_limit_bytes > 0.85',
-                            'for': '10m',
-                            'labels': {
-                                'severity': 'warning',
-                                'service': 'milvus'
-                            },
-                            'annotations': {
-                                'summary': 'Milvus high memory usage',
-                                'description': 'Memory usage is {{ $value | humanizePercentage }} for instance {{ $labels.instance }}.'
-                            }
-                        },
-                        {
-                            'alert': 'MilvusLowThroughput',
-                            'expr': 'rate(milvus_requests_total[5m]) < 100',
-                            'for': '15m',
-                            'labels': {
-                                'severity': 'warning',
-                                'service': 'milvus'
-                            },
-                            'annotations': {
-                                'summary': 'Milvus low throughput',
-                                'description': 'Request rate is {{ $value }} requests/second, which is below expected threshold.'
-                            }
-                        }
-                    ]
-                },
-                {
-                    'name': 'infrastructure.rules',
-                    'rules': [
-                        {
-                            'alert': 'HighCPUUsage',
-                            'expr': '100 - (avg by(instance) (rate(node_cpu_seconds_total{mode="idle"}[2m])) * 100) > 80',
-                            'for': '5m',
-                            'labels': {
-                                'severity': 'warning'
-                            },
-                            'annotations': {
-                                'summary': 'High CPU usage detected',
-                                'description': 'CPU usage is {{ $value }}% on {{ $labels.instance }}.'
-                            }
-                        },
-                        {
-                            'alert': 'HighMemoryUsage',
-                            'expr': '(1 - (node_memory_MemAvailable_bytes / node_memory_MemTotal_bytes)) * 100 > 85',
-                            'for': '5m',
-                            'labels': {
-                                'severity': 'warning'
-                            },
-                            'annotations': {
-                                'summary': 'High memory usage detected',
-                                'description': 'Memory usage is {{ $value }}% on {{ $labels.instance }}.'
-                            }
-                        },
-                        {
-                            'alert': 'DiskSpaceLow',
-                            'expr': '(1 - (node_filesystem_avail_bytes / node_filesystem_size_bytes)) * 100 > 85',
-                            'for': '5m',
-                            'labels': {
-                                'severity': 'critical'
-                            },
-                            'annotations': {
-                                'summary': 'Disk space running low',
-                                'description': 'Disk usage is {{ $value }}% on {{ $labels.instance }}:{{ $labels.mountpoint }}.'
-                            }
-                        }
-                    ]
-                }
-            ]
-        }
-        
-        with open(self.alerts_dir / 'milvus-alerts.yml', 'w') as f:
-            yaml.dump(milvus_alerts, f, default_flow_style=False)
+        for filename in ('milvus-alerts.yml', 'sla-alerts.yml'):
+            _write_if_changed(self.alerts_dir / filename, _static_config_bytes(filename))
         
-        # SLA 기반 알림
-        sla_alerts = {
-            'groups': [
-                {
-                    'name': 'sla.rules',
-                    'rules': [
-                        {
-                            'alert': 'SLAAvailabilityBreach',
-                            'expr': 'avg_over_time(up{job="milvus-production"}[1h]) < 0.999',
-                            'for': '0m',
-                            'labels': {
-                                'severity': 'critical',
-                                'sla': 'availability'
-                            },
-                            'annotations': {
-                                'summary': 'SLA availability breach detected',
-                                'description': 'Availability SLA (99.9%) has been breached. Current: {{ $value | humanizePercentage }}'
-                            }
-                        },
-                        {
-                            'alert': 'SLAResponseTimeBreach',
-                            'expr': 'histogram_quantile(0.95, avg_over_time(milvus_request_duration_seconds_bucket[1h])) > 0.2',
-                            'for': '0m',
-                            'labels': {
-                                'severity': 'critical',
-                                'sla': 'response_time'
-                            },
-                            'annotations': {
-                                'summary': 'SLA response time breach detected',
-                                'description': '95th percentile response time SLA (200ms) has been breached. Current: {{ $value }}s'
-                            }
-                        }
-                    ]
-                }
-            ]
-        }
-        
-        with open(self.alerts_dir / 'sla-alerts.yml', 'w') as f:
-            yaml.dump(sla_alerts, f, default_flow_style=False)
-        
-        print("  ✅ 알림 규칙 생성됨")
+        self._log("  ✅ 알림 규칙 생성됨")
     
     def create_grafana_dashboards(self):
         """Grafana 대시보드 생성"""
-        print("📈 Grafana 대시보드 설정 중...")
-        
-        # 메인 운영 대시보드
-        main_dashboard = {
-            'dashboard': {
-                'title': 'Milvus Production Overview',
-                'tags': ['milvus', 'production'],
-                'timezone': 'browser',
-                'refresh': '30s',
-                'time': {
-                    'from': 'now-1h',
-                    'to': 'now'
-                },
-                'panels': [
-                    {
-                        'id': 1,
-                        'title': 'Service Status',
-                        'type': 'stat',
-                        'targets': [
-                            {
-                                'expr': 'up{job="milvus-production"}',
-                                'legendFormat': 'Milvus Status'
-                            }
-                        ],
-                        'fieldConfig': {
-                            'defaults': {
-                                'color': {
-                                    'mode': 'thresholds'
-                                },
-                                'thresholds': {
-                                    'steps': [
-                                        {'color': 'red', 'value': 0},
-                                        {'color': 'green', 'value': 1}
-                                    ]
-                                }
-                            }
-                        },
-                        'gridPos': {'h': 4, 'w': 6, 'x': 0, 'y': 0}
-                    },
-                    {
-                        'id': 2,
-                        'title': 'Request Rate (QPS)',
-                        'type': 'graph',
-                        'targets': [
-                            {
-                                'expr': 'rate(milvus_requests_total[5m])',
-                                'legendFormat': 'Requests/sec'
-                            }
-                        ],
-                        'yAxes': [
-                            {'label': 'Requests/sec', 'min': 0}
-                        ],
-                        'gridPos': {'h': 8, 'w': 12, 'x': 6, 'y': 0}
-                    },
-                    {
-                        'id': 3,
-                        'title': 'Response Time (95th percentile)',
-                        'type': 'graph',
-                        'targets': [
-                            {
-                                'expr': 'histogram_quantile(0.95, milvus_request_duration_seconds_bucket)',
-                                'legendFormat': '95th percentile'
-                            },
-                            {
-                                'expr': 'histogram_quantile(0.50, milvus_request_duration_seconds_bucket)', 
-                                'legendFormat': '50th percentile'
-                            }
-                        ],
-                        'yAxes': [
-                            {'label': 'Seconds', 'min': 0}
-                        ],
-                        'gridPos': {'h': 8, 'w': 12, 'x': 0, 'y': 8}
-                    },
-                    {
-                        'id': 4,
-                        'title': 'Error Rate',
-                        'type': 'graph',
-                        'targets': [
-                            {
-                                'expr': 'rate(milvus_errors_total[5m]) / rate(milvus_requests_total[5m])',
-                                'legendFormat': 'Error Rate'
-                            }
-                        ],
-                        'yAxes': [
-                            {'label': 'Percentage', 'min': 0, 'max': 1}
-                        ],
-                        'gridPos': {'h': 8, 'w': 12, 'x': 12, 'y': 8}
-                    },
-                    {
-                        'id': 5,
-                        'title': 'Memory Usage',
-                        'type': 'graph',
-                        'targets': [
-                            {
-                                'expr': 'milvus_memory_usage_bytes / 1024 / 1024 / 1024',
-                                'legendFormat': 'Memory Usage (GB)'
-                            }
-                        ],
-                        'gridPos': {'h': 8, 'w': 12, 'x': 0, 'y': 16}
-                    },
-                    {
-                        'id': 6,
-                        'title': 'Active Collections',
-                        'type': 'stat',
-                        'targets': [
-                            {
-                                'expr': 'milvus_collections_total',
-                                'legendFormat': 'Collections'
-                            }
-                        ],
-                        'gridPos': {'h': 8, 'w': 12, 'x': 12, 'y': 16}
-                    }
-                ]
-            }
-        }
-        
-        with open(self.dashboards_dir / 'main-dashboard.json', 'w') as f:
-            json.dump(main_dashboard, f, indent=2)
-        
-        # SLA 대시보드
-        sla_dashboard = {
-            'dashboard': {
-                'title': 'Milvus SLA Monitoring',
-                'tags': ['milvus', 'sla'],
-                'panels': [
-                    {
-                        'id': 1,
-                        'title': 'Availability SLA (99.9%)',
-                        'type': 'stat',
-                        'targets': [
-                            {
-                                'expr': 'avg_over_time(up{job="milvus-production"}[24h]) * 100',
-                                'legendFormat': 'Availability %'
-                            }
-                        ],
-                        'thresholds': [
-                            {'color': 'red', 'value': 0},
-                            {'color': 'yellow', 'value': 99.0},
-                            {'color': 'green', 'value': 99.9}
-                        ]
-                    },
-                    {
-                        'id': 2,
-                        'title': 'Response Time SLA (95% < 200ms)',
-                        'type': 'stat',
-                        'targets': [
-                            {
-                                'expr': 'histogram_quantile(0.95, avg_over_time(milvus_request_duration_seconds_bucket[24h])) * 1000',
-                                'legendFormat': '95th percentile (ms)'
-                            }
-                        ],
-                        'thresholds': [
-                            {'color': 'green', 'value': 0},
-                            {'color': 'yellow', 'value': 200},
-                            {'color': 'red', 'value': 500}
-                        ]
-                    }
-                ]
-            }
-        }
-        
-        with open(self.dashboards_dir / 'sla-dashboard.json', 'w') as f:
-            json.dump(sla_dashboard, f, indent=2)
+        self._log("📈 Grafana 대시보드 설정 중...")
         
-        # 인프라 대시보드
-        infra_dashboard = {
-            'dashboard': {
-                'title': 'Milvus Infrastructure Monitoring',
-                'tags': ['milvus', 'infrastructure'],
-                'panels': [
-                    {
-                        'id': 1,
-                        'title': 'CPU Usage',
-                        'type': 'graph',
-                        'targets': [
-                            {
-                                'expr': '100 - (avg by(instance) (rate(node_cpu_seconds_total{mode="idle"}[2m])) * 100)',
-                                'legendFormat': 'CPU Usage %'
-                            }
-                        ]
-                    },
-                    {
-                        'id': 2,
-                        'title': 'Memory Usage',
-                        'type': 'graph',
-                        'targets': [
-                            {
-                                'expr': '(1 - (node_memory_MemAvailable_bytes / node_memory_MemTotal_bytes)) * 100',
-                                'legendFormat': 'Memory Usage %'
-                            }
-                        ]
-                    },
-                    {
-                        'id': 3,
-                        'title': 'Network I/O',
-                        'type': 'graph',
-                        'targets': [
-                            {
-                                'expr': 'rate(node_network_receive_bytes_total[5m])',
-                                'legendFormat': 'Receive'
-                            },
-                            {
-                                'expr': 'rate(node_network_transmit_bytes_total[5m])',
-                                'legendFormat': 'Transmit'
-                            }
-                        ]
-                    }
-                ]
-            }
-        }
+        for filename in ('main-dashboard.json', 'sla-dashboard.json', 'infrastructure-dashboard.json'):
+            _write_if_changed(self.dashboards_dir / filename, _static_config_bytes(filename))
         
-        with open(self.dashboards_dir / 'infrastructure-dashboard.json', 'w') as f:
-            json.dump(infra_dashboard, f, indent=2)
-        
-        print("  ✅ Grafana 대시보드 생성됨")
+        self._log("  ✅ Grafana 대시보드 생성됨")
     
     def create_alertmanager_config(self):
         """Alertmanager 설정 생성"""
-        print("📢 Alertmanager 알림 설정 중...")
+        self._log("📢 Alertmanager 알림 설정 중...")
         
-        alertmanager_config = {
-            'global': {
-                'smtp_smarthost': 'smtp.example.com:587',
-                'smtp_from': 'alerts@example.com'
-            },
-            'route': {
-                'group_by': ['alertname'],
-                'group_wait': '10s',
-                'group_interval': '10s',
-                'repeat_interval': '1h',
-                'receiver': 'web.hook',
-                'routes': [
-                    {
-                        'match': {
-                            'severity': 'critical'
-                        },
-                        'receiver': 'critical-alerts',
-                        'repeat_interval': '5m'
-                    },
-                    {
-                        'match': {
-                            'severity': 'warning'
-                        },
-                        'receiver': 'warning-alerts',
-                        'repeat_interval': '30m'
-                    }
-                ]
-            },
-            'receivers': [
-                {
-                    'name': 'web.hook',
-                    'webhook_configs': [
-                        {
-                            'url': 'http://webhook.example.com/alerts',
-                            'send_resolved': True
-                        }
-                    ]
-                },
-                {
-                    'name': 'critical-alerts',
-                    'email_configs': [
-                        {
-                            'to': 'oncall@example.com',
-                            'subject': '[CRITICAL] Milvus Alert: {{ .GroupLabels.alertname }}',
-                            'body': '''
-Alert: {{ .GroupLabels.alertname }}
-Severity: {{ .CommonLabels.severity }}
-Description: {{ range .Alerts }}{{ .Annotations.description }}{{ end }}
-Instance: {{ .CommonLabels.instance }}
-Time: {{ .CommonAnnotations.timestamp }}
-'''
-                        }
-                    ],
-                    'slack_configs': [
-                        {
-                            'api_url': 'https://hooks.slack.com/services/YOUR/SLACK/WEBHOOK',
-                            'channel': '#alerts-critical',
-                            'title': 'Critical Alert: {{ .GroupLabels.alertname }}',
-                            'text': '{{ range .Alerts }}{{ .Annotations.description }}{{ end }}'
-                        }
-                    ],
-                    'pagerduty_configs': [
-                        {
-                            'service_key': 'YOUR_PAGERDUTY_KEY',
-                            'description': '{{ .GroupLabels.alertname }}: {{ range .Alerts }}{{ .Annotations.description }}{{ end }}'
-                        }
-                    ]
-                },
-                {
-                    'name': 'warning-alerts',
-                    'email_configs': [
-                        {
-                            'to': 'team@example.com',
-                            'subject': '[WARNING] Milvus Alert: {{ .GroupLabels.alertname }}',
-                            'body': '''
-Alert: {{ .GroupLabels.alertname }}
-Severity: {{ .CommonLabels.severity }}
-Description: {{ range .Alerts }}{{ .Annotations.description }}{{ end }}
-'''
-                        }
-                    ]
-                }
-            ]
-        }
+        _write_if_changed(self.monitoring_dir / 'alertmanager.yml', _static_config_bytes('alertmanager.yml'))
         
-        with open(self.monitoring_dir / 'alertmanager.yml', 'w') as f:
-            yaml.dump(alertmanager_config, f, default_flow_style=False)
-        
-        print("  ✅ Alertmanager 설정 생성됨")
+        self._log("  ✅ Alertmanager 설정 생성됨")
     
     def simulate_metrics_collection(self):
         """메트릭 수집 시뮬레이션"""
         print("\n📊 메트릭 수집 시뮬레이션 시작...")
         
-        # 시뮬레이션된 메트릭 데이터 생성
-        metrics = {
-            'response_time_ms': [],
-            'requests_per_second': [],
-            'error_rate': [],
-            'memory_usage_gb': [],
-            'cpu_usage_percent': [],
-            'availability': []
-        }
+        rng = self._rng
         
-        # 24시간 데이터 시뮬레이션 (5분 간격)
-        time_points = 24 * 12  # 288 data points
+        time_points = SIMULATION_TIME_POINTS
         
-        for i in range(time_points):
-            # 시간대별 패턴 적용
-            hour = (i * 5) // 60
-            
-            # 업무 시간(9-18시)에 트래픽 증가
-            if 9 <= hour <= 18:
-                traffic_multiplier = 1.5 + random.uniform(-0.2, 0.3)
-            else:
-                traffic_multiplier = 0.7 + random.uniform(-0.1, 0.2)
-            
-            # 기본 메트릭 값들
-            base_response_time = 80
-            base_qps = 1500
-            base_error_rate = 0.002
-            base_memory = 8.5
-            base_cpu = 45
-            
-            # 트래픽에 따른 성능 영향
-            response_time = base_response_time * (1 + (traffic_multiplier - 1) * 0.3)
-            qps = base_qps * traffic_multiplier
-            error_rate = base_error_rate * (1 + (traffic_multiplier - 1) * 0.5)
-            memory_usage = base_memory * (1 + (traffic_multiplier - 1) * 0.2)
-            cpu_usage = base_cpu * traffic_multiplier
-            
-            # 랜덤 노이즈 추가
-            metrics['response_time_ms'].append(max(20, response_time + random.gauss(0, 15)))
-            metrics['requests_per_second'].append(max(100, qps + random.gauss(0, 200)))
-            metrics['error_rate'].append(max(0, error_rate + random.gauss(0, 0.001)))
-            metrics['memory_usage_gb'].append(max(4, memory_usage + random.gauss(0, 0.5)))
-            metrics['cpu_usage_percent'].append(max(10, min(100, cpu_usage + random.gauss(0, 10))))
-            
-            # 가용성 (99.95% 정도)
-            availability = 1.0 if random.random() > 0.0005 else 0.0
-            metrics['availability'].append(availability)
+        # 시간대별 패턴 적용: 업무 시간에 트래픽 증가 (시점별 범위에서 균등분포 한 번 추출)
+        traffic_multiplier = rng.random(time_points)
+        traffic_multiplier *= _TRAFFIC_SPAN
+        traffic_multiplier += _TRAFFIC_LOW
+        load = traffic_multiplier - 1
+        
+        # 트래픽에 따른 성능 영향 + 랜덤 노이즈: 한 번의 정규분포 추출과 제자리 연산으로 계산
+        samples = np.empty((len(METRIC_NAMES), time_points))
+        modeled = samples[:len(_METRIC_BASE)]
+        np.multiply(_TRAFFIC_SENSITIVITY[:, None], load, out=modeled)
+        modeled += 1
+        modeled *= _METRIC_BASE[:, None]
+        noise = rng.standard_normal(modeled.shape)
+        noise *= _NOISE_STD[:, None]
+        modeled += noise
+        np.maximum(modeled, _METRIC_FLOOR[:, None], out=modeled)
+        cpu = samples[METRIC_INDEX['cpu_usage_percent']]
+        np.minimum(cpu, 100, out=cpu)
+        
+        # 가용성 (99.95% 정도)
+        samples[METRIC_INDEX['availability']] = rng.random(time_points) > 0.0005
         
-        self.metrics_data = metrics
+        self._append_metrics(samples)
         
         # 현재 상태 요약
-        current_metrics = {
-            'response_time_ms': metrics['response_time_ms'][-1],
-            'requests_per_second': metrics['requests_per_second'][-1],
-            'error_rate': metrics['error_rate'][-1],
-            'memory_usage_gb': metrics['memory_usage_gb'][-1],
-            'cpu_usage_percent': metrics['cpu_usage_percent'][-1],
-            'availability': metrics['availability'][-1]
-        }
+        current_metrics = dict(zip(METRIC_NAMES, samples[:, -1].tolist()))
         
         print(f"  📈 현재 메트릭 상태:")
         print(f"    응답시간: {current_metrics['response_time_ms']:.1f}ms")
@@ -738,119 +948,78 @@ Description: {{ range .Alerts }}{{ .Annotations.description }}{{ end }}
         
         return current_metrics
     
-    def check_sla_compliance(self) -> Dict[str, Dict]:
-        """SLA 준수 여부 확인"""
-        print("\n🎯 SLA 준수 상태 확인 중...")
+    def check_sla_compliance(self) -> Tuple[Dict[str, Dict], bool]:
+        """SLA 준수 여부 확인 (SLA 별 결과, 전체 준수 여부)"""
+        lines = ["\n🎯 SLA 준수 상태 확인 중..."]
         
         sla_results = {}
-        
-        for sla in self.slas:
-            if sla.metric_name == "response_time_ms":
-                data = self.metrics_data['response_time_ms']
-                # 95th percentile 계산
-                value = statistics.quantiles(data, n=20)[18]  # 95th percentile
-                target_met = value <= sla.threshold
-                
-            elif sla.metric_name == "error_rate":
-                data = self.metrics_data['error_rate']
-                value = statistics.mean(data)
-                target_met = value <= sla.threshold
-                
-            elif sla.metric_name == "requests_per_second":
-                data = self.metrics_data['requests_per_second']
-                value = statistics.mean(data)
-                target_met = value >= sla.threshold
-                
-            elif sla.metric_name == "up":
-                data = self.metrics_data['availability']
-                value = statistics.mean(data) * 100  # 백분율로 변환
-                target_met = value >= sla.target_percentage
-            
-            else:
-                continue
+        overall = True  # 순회하면서 누적 (보고서에서 결과를 다시 훑지 않음)
+        
+        metrics_data = self.metrics_data
+        format_status = _SLA_STATUS_TEMPLATE.format
+        
+        for sla, data_key, reducer, target, compare, sample_compare, judge_by_value in self._compiled_slas:
+            data = metrics_data[data_key]
+            value = float(reducer(data))
+            # 임계값을 만족한 샘플 비율: 비교 마스크 한 번 + count_nonzero
+            compliant = np.count_nonzero(sample_compare(data, sla.threshold))
+            compliance = 100.0 * float(compliant) / max(data.size, 1)
+            # 응답시간은 p95 <= 임계값, 나머지는 샘플 준수율 >= SLA 목표 비율
+            target_met = compare(value, target) if judge_by_value else compliance >= sla.target_percentage
+            overall &= target_met
             
             sla_results[sla.name] = {
                 'current_value': value,
-                'target': sla.threshold if sla.name != 'availability' else sla.target_percentage,
+                'target': target,
                 'target_met': target_met,
-                'sla_percentage': sla.target_percentage
+                'sla_percentage': sla.target_percentage,
+                'compliance_percentage': compliance
             }
             
-            status = "✅ 준수" if target_met else "❌ 위반"
-            print(f"  {sla.name.upper()}: {status}")
-            print(f"    현재값: {value:.2f}")
-            print(f"    목표값: {sla.threshold if sla.name != 'availability' else sla.target_percentage}")
-            print(f"    SLA: {sla.target_percentage}%")
-        
-        return sla_results
-    
-    def generate_alerts(self, current_metrics: Dict[str, float]) -> List[Alert]:
-        """알림 생성"""
-        alerts = []
-        
-        # 응답시간 체크
-        if current_metrics['response_time_ms'] > 200:
-            severity = AlertSeverity.CRITICAL if current_metrics['response_time_ms'] > 500 else AlertSeverity.WARNING
-            alerts.append(Alert(
-                name="HighResponseTime",
-                severity=severity,
-                message=f"Response time is {current_metrics['response_time_ms']:.1f}ms",
-                timestamp=datetime.now(),
-                labels={'service': 'milvus', 'metric': 'response_time'}
-            ))
+            lines.append(format_status(
+                name=sla.name.upper(), status="✅ 준수" if target_met else "❌ 위반", value=value,
+                target=target, sla_percentage=sla.target_percentage, compliance=compliance))
         
-        # 오류율 체크
-        if current_metrics['error_rate'] > 0.01:
-            alerts.append(Alert(
-                name="HighErrorRate",
-                severity=AlertSeverity.CRITICAL,
-                message=f"Error rate is {current_metrics['error_rate']:.3f}%",
-                timestamp=datetime.now(),
-                labels={'service': 'milvus', 'metric': 'error_rate'}
-            ))
+        # 출력은 한 번에 기록
+        sys.stdout.write("\n".join(lines) + "\n")
         
-        # 메모리 사용량 체크
-        if current_metrics['memory_usage_gb'] > 12:
-            alerts.append(Alert(
-                name="HighMemoryUsage",
-                severity=AlertSeverity.WARNING,
-                message=f"Memory usage is {current_metrics['memory_usage_gb']:.1f}GB",
-                timestamp=datetime.now(),
-                labels={'service': 'milvus', 'metric': 'memory'}
-            ))
+        return sla_results, overall
+    
+    def generate_alerts(self, current_metrics: Dict[str, float], now: Optional[datetime] = None) -> List[Alert]:
+        """알림 생성 (같은 수집 주기의 알림은 같은 시각 now 를 공유)"""
+        if now is None:
+            now = datetime.now()
         
-        # CPU 사용량 체크
-        if current_metrics['cpu_usage_percent'] > 80:
-            alerts.append(Alert(
-                name="HighCPUUsage",
-                severity=AlertSeverity.WARNING,
-                message=f"CPU usage is {current_metrics['cpu_usage_percent']:.1f}%",
-                timestamp=datetime.now(),
-                labels={'service': 'milvus', 'metric': 'cpu'}
-            ))
+        # 모든 규칙의 임계값을 한 번에 비교하고, 발생한 규칙만 Alert 로 만듦
+        values = np.fromiter((current_metrics[key] for key in _ALERT_METRICS),
+                             dtype=np.float64, count=len(_ALERT_METRICS))
+        fired = np.where(_ALERT_BELOW, values <= _ALERT_THRESHOLDS, values > _ALERT_THRESHOLDS)
+        critical = values > _ALERT_CRITICAL_ABOVE
         
-        # 서비스 다운 체크
-        if current_metrics['availability'] == 0:
+        alerts = []
+        for i in np.flatnonzero(fired).tolist():
+            name, _, _, _, severity, _, message, labels = _ALERT_RULES[i]
+            value = values[i]
             alerts.append(Alert(
-                name="ServiceDown",
-                severity=AlertSeverity.CRITICAL,
-                message="Milvus service is not responding",
-                timestamp=datetime.now(),
-                labels={'service': 'milvus', 'metric': 'availability'}
+                name=name,
+                severity=AlertSeverity.CRITICAL if critical[i] else severity,
+                message=message.format(value=value),
+                timestamp=now,
+                labels=labels
             ))
         
         return alerts
     
     def capacity_planning_analysis(self):
         """용량 계획 분석"""
-        print("\n📊 용량 계획 분석 중...")
+        lines = ["\n📊 용량 계획 분석 중..."]
         
-        # 현재 사용량 분석
+        # 현재 사용량 분석 (누적 집계값 사용, 버퍼 재스캔 없음)
         current_usage = {
-            'memory_avg': statistics.mean(self.metrics_data['memory_usage_gb']),
-            'cpu_avg': statistics.mean(self.metrics_data['cpu_usage_percent']),
-            'qps_avg': statistics.mean(self.metrics_data['requests_per_second']),
-            'qps_max': max(self.metrics_data['requests_per_second'])
+            'memory_avg': self.running_mean('memory_usage_gb'),
+            'cpu_avg': self.running_mean('cpu_usage_percent'),
+            'qps_avg': self.running_mean('requests_per_second'),
+            'qps_max': self.running_max('requests_per_second')
         }
         
         # 성장률 계산 (시뮬레이션)
@@ -858,12 +1027,10 @@ Description: {{ range .Alerts }}{{ .Annotations.description }}{{ end }}
         
         # 6개월 후 예상 사용량
         months_ahead = 6
-        projected_usage = {
-            'memory_gb': current_usage['memory_avg'] * (1 + growth_rate) ** months_ahead,
-            'cpu_percent': current_usage['cpu_avg'] * (1 + growth_rate) ** months_ahead,
-            'qps': current_usage['qps_avg'] * (1 + growth_rate) ** months_ahead,
-            'qps_peak': current_usage['qps_max'] * (1 + growth_rate) ** months_ahead
-        }
+        growth_factor = (1 + growth_rate) ** months_ahead  # 누적 성장 배수는 한 번만 계산
+        projected = np.fromiter(current_usage.values(), dtype=np.float64, count=len(current_usage))
+        projected *= growth_factor
+        projected_usage = dict(zip(('memory_gb', 'cpu_percent', 'qps', 'qps_peak'), projected.tolist()))
         
         # 용량 제한 (현재 설정)
         capacity_limits = {
@@ -884,22 +1051,21 @@ Description: {{ range .Alerts }}{{ .Annotations.description }}{{ end }}
         if projected_usage['qps_peak'] > capacity_limits['qps_capacity'] * 0.8:
             capacity_warnings.append(f"처리량: {months_ahead}개월 후 최대 {projected_usage['qps_peak']:.0f} QPS 필요")
         
-        print(f"  📈 현재 리소스 사용량:")
-        print(f"    메모리: {current_usage['memory_avg']:.1f}GB (평균)")
-        print(f"    CPU: {current_usage['cpu_avg']:.1f}% (평균)")
-        print(f"    QPS: {current_usage['qps_avg']:.0f} (평균), {current_usage['qps_max']:.0f} (최대)")
+        lines.append(f"  📈 현재 리소스 사용량:")
+        lines.append(f"    메모리: {current_usage['memory_avg']:.1f}GB (평균)")
+        lines.append(f"    CPU: {current_usage['cpu_avg']:.1f}% (평균)")
+        lines.append(f"    QPS: {current_usage['qps_avg']:.0f} (평균), {current_usage['qps_max']:.0f} (최대)")
         
-        print(f"\n  🔮 {months_ahead}개월 후 예상 사용량:")
-        print(f"    메모리: {projected_usage['memory_gb']:.1f}GB")
-        print(f"    CPU: {projected_usage['cpu_percent']:.1f}%")
-        print(f"    QPS: {projected_usage['qps']:.0f} (평균), {projected_usage['qps_peak']:.0f} (최대)")
+        lines.append(f"\n  🔮 {months_ahead}개월 후 예상 사용량:")
+        lines.append(f"    메모리: {projected_usage['memory_gb']:.1f}GB")
+        lines.append(f"    CPU: {projected_usage['cpu_percent']:.1f}%")
+        lines.append(f"    QPS: {projected_usage['qps']:.0f} (평균), {projected_usage['qps_peak']:.0f} (최대)")
         
         if capacity_warnings:
-            print(f"\n  ⚠️  용량 계획 권고사항:")
-            for warning in capacity_warnings:
-                print(f"    • {warning}")
+            lines.append(f"\n  ⚠️  용량 계획 권고사항:")
+            lines.extend(f"    • {warning}" for warning in capacity_warnings)
         else:
-            print(f"\n  ✅ 현재 용량으로 {months_ahead}개월간 충분함")
+            lines.append(f"\n  ✅ 현재 용량으로 {months_ahead}개월간 충분함")
         
         # 스케일링 권장사항
         scaling_recommendations = []
@@ -911,9 +1077,11 @@ Description: {{ range .Alerts }}{{ .Annotations.description }}{{ end }}
             scaling_recommendations.append("인스턴스: 현재 1대에서 2-3대로 확장 권장")
         
         if scaling_recommendations:
-            print(f"\n  🚀 스케일링 권장사항:")
-            for rec in scaling_recommendations:
-                print(f"    • {rec}")
+            lines.append(f"\n  🚀 스케일링 권장사항:")
+            lines.extend(f"    • {rec}" for rec in scaling_recommendations)
+        
+        # 출력은 한 번에 기록
+        sys.stdout.write("\n".join(lines) + "\n")
         
         return {
             'current_usage': current_usage,
@@ -1082,31 +1250,46 @@ fi
             ('test-alerts.sh', alert_test_script)
         ]
         
-        for filename, content in scripts:
-            with open(scripts_dir / filename, 'w') as f:
-                f.write(content)
+        # 서로 독립적인 파일이므로 병렬로 기록 (내용이 같으면 건너뜀, 실행 권한은 바로 설정)
+        with ThreadPoolExecutor(max_workers=len(scripts)) as executor:
+            list(executor.map(lambda item: _write_script(scripts_dir / item[0], item[1]), scripts))
+        
+        print("  ✅ 모니터링 운영 스크립트 생성됨 (실행 권한 설정 완료)")
+    
+    @staticmethod
+    def _iter_recommendations(report: Dict, current_metrics: Dict, capacity_analysis: Dict):
+        """보고서 권장사항을 순서대로 생성"""
+        if not report['executive_summary']['sla_compliance']:
+            yield "SLA 위반 항목에 대한 즉시 조치 필요"
+        
+        if report['executive_summary']['critical_alerts'] > 0:
+            yield "긴급 알림에 대한 즉시 대응 필요"
         
-        print("  ✅ 모니터링 운영 스크립트 생성됨")
-        print("  💫 실행 권한 설정 필요:")
-        for filename, _ in scripts:
-            print(f"    $ chmod +x monitoring-scripts/{filename}")
+        if current_metrics['memory_usage_gb'] > 12:
+            yield "메모리 사용량 최적화 또는 용량 증설 검토"
+        
+        yield from capacity_analysis['scaling_recommendations']
     
-    def generate_monitoring_report(self, current_metrics: Dict, sla_results: Dict, capacity_analysis: Dict):
-        """모니터링 종합 보고서 생성"""
+    def generate_monitoring_report(self, current_metrics: Dict, sla_check: Tuple[Dict[str, Dict], bool],
+                                   capacity_analysis: Dict, now: Optional[datetime] = None):
+        """모니터링 종합 보고서 생성 (sla_check 는 check_sla_compliance 의 반환값)"""
+        if now is None:
+            now = datetime.now()
+        sla_results, sla_compliance = sla_check
         print("\n📄 종합 모니터링 보고서 생성 중...")
         
         report = {
             'report_metadata': {
-                'generated_at': datetime.now().isoformat(),
-                'reporting_period': '24 hours',
+                'generated_at': now.isoformat(),
+                'reporting_period': f"{self._filled * METRIC_SAMPLE_MINUTES / 60:g} hours",  # 보관 샘플이 덮는 기간
                 'system': 'Milvus Production',
                 'version': '2.4.0'
             },
             'executive_summary': {
                 'overall_health': 'healthy',
-                'sla_compliance': all(result['target_met'] for result in sla_results.values()),
-                'critical_alerts': len([a for a in self.active_alerts if a.severity == AlertSeverity.CRITICAL]),
-                'warning_alerts': len([a for a in self.active_alerts if a.severity == AlertSeverity.WARNING])
+                'sla_compliance': sla_compliance,
+                'critical_alerts': len(self._alerts_by_severity[AlertSeverity.CRITICAL]),
+                'warning_alerts': len(self._alerts_by_severity[AlertSeverity.WARNING])
             },
             'current_metrics': current_metrics,
             'sla_compliance': sla_results,
@@ -1117,32 +1300,21 @@ fi
                     'severity': alert.severity.value,
                     'message': alert.message,
                     'timestamp': alert.timestamp.isoformat(),
-                    'labels': alert.labels
+                    'labels': dict(alert.labels)
                 }
-                for alert in self.active_alerts
+                for alert in self.active_alerts.values()
             ],
-            'recommendations': []
         }
         
-        # 권장사항 생성
-        if not report['sla_compliance']:
-            report['recommendations'].append("SLA 위반 항목에 대한 즉시 조치 필요")
-        
-        if report['executive_summary']['critical_alerts'] > 0:
-            report['recommendations'].append("긴급 알림에 대한 즉시 대응 필요")
-        
-        if current_metrics['memory_usage_gb'] > 12:
-            report['recommendations'].append("메모리 사용량 최적화 또는 용량 증설 검토")
-        
-        if capacity_analysis['scaling_recommendations']:
-            report['recommendations'].extend(capacity_analysis['scaling_recommendations'])
+        # 권장사항 생성 (제너레이터를 한 번에 리스트로 만듦)
+        report['recommendations'] = list(self._iter_recommendations(report, current_metrics, capacity_analysis))
         
         # 보고서 저장
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         report_file = self.monitoring_dir / f"monitoring_report_{timestamp}.json"
         
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        # 디스크에는 compact JSON (indent 없이 C 인코더 사용, 사람이 볼 때는 python -m json.tool)
+        report_file.write_bytes(json.dumps(report, separators=(',', ':'), default=str).encode('utf-8'))
         
         print(f"  ✅ 모니터링 보고서 저장됨: {report_file.name}")
         
@@ -1164,9 +1336,14 @@ def main():
     """메인 실행 함수"""
     print("📈 Milvus 프로덕션 모니터링 시스템")
     print("=" * 80)
-    print(f"실행 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    now = datetime.now()  # 알림/보고서가 공유하는 실행 시각
+    print(f"실행 시간: {now.strftime('%Y-%m-%d %H:%M:%S')}")
     
-    manager = ProductionMonitoringManager()
+    try:
+        manager = ProductionMonitoringManager()
+    except ValueError as e:  # 잘못된 PROM_SCRAPE_INTERVAL 등 설정 오류는 트레이스백 없이 안내
+        print(f"❌ 설정 오류: {e}")
+        return
     
     try:
         # 1. 모니터링 설정 생성
@@ -1174,10 +1351,7 @@ def main():
         print(" 📊 모니터링 시스템 구축")
         print("=" * 80)
         
-        manager.create_prometheus_config()
-        manager.create_alert_rules()
-        manager.create_grafana_dashboards()
-        manager.create_alertmanager_config()
+        manager.generate_all_configs()
         
         # 2. 모니터링 스크립트 생성
         print("\n" + "=" * 80)
@@ -1191,20 +1365,21 @@ def main():
         print("=" * 80)
         
         current_metrics = manager.simulate_metrics_collection()
-        sla_results = manager.check_sla_compliance()
+        sla_check = manager.check_sla_compliance()
         
         # 4. 알림 생성
         print("\n" + "=" * 80)
         print(" 🚨 알림 시스템 테스트")
         print("=" * 80)
         
-        alerts = manager.generate_alerts(current_metrics)
-        manager.active_alerts = alerts
+        alerts = manager.generate_alerts(current_metrics, now)
+        for alert in alerts:
+            manager.add_alert(alert)
         
         if alerts:
             print(f"  🔔 생성된 알림: {len(alerts)}건")
             for alert in alerts:
-                severity_emoji = {"critical": "🔴", "warning": "🟡", "info": "🔵"}.get(alert.severity.value, "⚪")
+                severity_emoji = _SEVERITY_EMOJI.get(alert.severity, "⚪")
                 print(f"    {severity_emoji} [{alert.severity.value.upper()}] {alert.name}: {alert.message}")
         else:
             print(f"  ✅ 활성 알림 없음 - 시스템 정상")
@@ -1221,7 +1396,7 @@ def main():
         print(" 📄 종합 모니터링 보고서")
         print("=" * 80)
         
-        report = manager.generate_monitoring_report(current_metrics, sla_results, capacity_analysis)
+        report = manager.generate_monitoring_report(current_metrics, sla_check, capacity_analysis, now)
         
         # 7. 요약
         print("\n" + "=" * 80)
@@ -1243,8 +1418,7 @@ def main():
             "monitoring-scripts/test-alerts.sh"
         ]
         
-        for resource in monitoring_resources:
-            print(f"  📄 {resource}")
+        sys.stdout.writelines(f"  📄 {resource}\n" for resource in monitoring_resources)
         
         print("\n📊 모니터링 대시보드 URL:")
         dashboard_urls = [
@@ -1255,8 +1429,7 @@ def main():
             "http://alertmanager.example.com (Alertmanager)"
         ]
         
-        for url in dashboard_urls:
-            print(f"  🌐 {url}")
+        sys.stdout.writelines(f"  🌐 {url}\n" for url in dashboard_urls)
         
         print("\n💡 운영 모니터링 체크리스트:")
         checklist = [
@@ -1269,8 +1442,7 @@ def main():
             "✅ 성능 기준선 설정 및 업데이트"
         ]
         
-        for item in checklist:
-            print(f"  {item}")
+        sys.stdout.writelines(f"  {item}\n" for item in checklist)
         
         print("\n🚀 운영 명령어 예시:")
         commands = [
@@ -1287,11 +1459,10 @@ def main():
             "./monitoring-scripts/test-alerts.sh"
         ]
         
-        for cmd in commands:
-            if cmd.startswith('#') or cmd == '':
-                print(f"  {cmd}")
-            else:
-                print(f"  $ {cmd}")
+        sys.stdout.writelines(
+            f"  {cmd}\n" if cmd.startswith('#') or cmd == '' else f"  $ {cmd}\n"
+            for cmd in commands
+        )
             
     except Exception as e:
         print(f"❌ 오류 발생: {e}")